@@ -1,5 +1,7 @@
 from flask import Flask, request, jsonify, send_from_directory
-from models import db, User
+from models import db, User, DEFAULT_PASSWORD_HASH_METHOD
+from extensions import cache
+from json_provider import OrjsonProvider
 from flask_login import LoginManager
 from flask_cors import CORS
 import os
@@ -11,6 +13,7 @@ import json
 from dateutil.relativedelta import relativedelta
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Force logs to go to stdout
 app.logger.addHandler(logging.StreamHandler(sys.stdout))
@@ -24,6 +27,12 @@ app.logger.setLevel(logging.INFO)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'a_secret_key')
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///users.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['PASSWORD_HASH_METHOD'] = os.getenv('PASSWORD_HASH_METHOD', DEFAULT_PASSWORD_HASH_METHOD)
+
+# In-process cache by default; use a shared backend (e.g. RedisCache) when
+# running several workers so invalidations reach all of them
+app.config['CACHE_TYPE'] = os.getenv('CACHE_TYPE', 'SimpleCache')
+app.config['CACHE_DEFAULT_TIMEOUT'] = 60
 
 # secure session cookie setup
 app.config['SESSION_COOKIE_HTTPONLY'] = True
@@ -31,6 +40,7 @@ app.config['SESSION_COOKIE_SECURE'] = False
 app.config['SESSION_COOKIE_SAMESITE'] = "Lax"
 
 db.init_app(app)
+cache.init_app(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 
@@ -0,0 +1,10 @@
+"""
+Flask extension instances for the Squad Goals application.
+
+Extensions are created unbound here and initialised against the app in
+app.py (and against the test app in tests/conftest.py).
+"""
+
+from flask_caching import Cache
+
+cache = Cache()
@@ -0,0 +1,38 @@
+"""
+orjson-backed JSON provider for the Squad Goals application.
+
+Installed on the app in app.py so that jsonify() and app.json use orjson's
+C encoder instead of the stdlib json module.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes with orjson.
+
+    Output matches DefaultJSONProvider: keys are sorted, and dates and other
+    types orjson doesn't handle natively go through DefaultJSONProvider.default
+    (dates are still serialized as HTTP date strings).
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string; stdlib formatting kwargs are ignored."""
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response, pretty-printed in debug mode like the default provider."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        body = orjson.dumps(obj, default=self.default, option=option | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -1,3 +1,4 @@
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -6,14 +7,24 @@ import uuid
 
 db = SQLAlchemy()
 
-# Function to generate UUID string
+# Password hashing method, overridable via the PASSWORD_HASH_METHOD config key.
+# Parameters are spelled out so stored hashes can be compared against it.
+DEFAULT_PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+# Function to generate UUID string. Uses the 32-char hex form (no dashes) to
+# keep primary/foreign keys and their indexes compact; columns stay
+# String(36) so ids created before the switch remain valid.
 def generate_uuid():
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
+
+
+def password_hash_method():
+    return current_app.config.get('PASSWORD_HASH_METHOD', DEFAULT_PASSWORD_HASH_METHOD)
 
 class User(UserMixin, db.Model):
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
     reset_token = db.Column(db.String(128), nullable=True, unique=True)
     reset_token_expiration = db.Column(db.DateTime, nullable=True)
 
@@ -26,11 +37,15 @@ class User(UserMixin, db.Model):
     goal_entries_received = db.relationship('GoalEntry', back_populates='user', lazy=True)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=password_hash_method(), salt_length=16)
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self):
+        """True if the stored hash was made with a different method or parameters."""
+        return self.password_hash.split('$', 1)[0] != password_hash_method()
+
 
 class UserProfile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -255,14 +270,27 @@ class GoalEntry(db.Model):
     __table_args__ = (
         # Constraint updated to use boundary_value
         db.UniqueConstraint('user_id', 'goal_id', 'boundary_value', name='_user_goal_boundary_uc'),
+        # History reads one user's entries in a squad (leading prefix); day views
+        # and upserts look up one user's entries at a boundary
+        db.Index('ix_goal_entry_lookup', 'user_id', 'squad_id', 'boundary_value', 'goal_id'),
+        # Squad day views read a squad's date range
+        db.Index('ix_goal_entry_squad_boundary', 'squad_id', 'boundary_value'),
     )
 
-    def to_dict(self):
+    # Columns read by to_dict(), so read paths can select just these
+    DICT_COLUMNS = ('id', 'goal_id', 'boundary_value', 'value', 'note')
+
+    @staticmethod
+    def row_to_dict(row):
+        """Serialize a GoalEntry or a result row carrying DICT_COLUMNS."""
         return {
-            "id": self.id,
-            "goal_id": self.goal_id,
+            "id": row.id,
+            "goal_id": row.goal_id,
             # Returning as 'date' for current frontend compatibility
-            "date": self.boundary_value, 
-            "value": self.value, 
-            "note": self.note,
-        }
\ No newline at end of file
+            "date": row.boundary_value,
+            "value": row.value,
+            "note": row.note,
+        }
+
+    def to_dict(self):
+        return GoalEntry.row_to_dict(self)
\ No newline at end of file
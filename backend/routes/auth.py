@@ -11,6 +11,7 @@ Handles:
 from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify
 from flask_login import login_user, logout_user, login_required, current_user
+from sqlalchemy.orm import load_only
 import secrets
 
 from models import db, User
@@ -28,7 +29,7 @@ def signup():
     if not username or not password:
         return jsonify({"message": "Username and password required"}), 400
 
-    if User.query.filter_by(username=username).first():
+    if db.session.query(User.query.filter_by(username=username).exists()).scalar():
         return jsonify({"message": "Username already exists"}), 409
 
     new_user = User(username=username)
@@ -42,8 +43,18 @@ def signup():
 def login():
     """Authenticate user and create session."""
     data = request.get_json()
-    user = User.query.filter_by(username=data.get('username')).first()
+    # Only the columns needed to verify the password and start the session
+    user = (
+        User.query
+        .options(load_only(User.id, User.password_hash))
+        .filter_by(username=data.get('username'))
+        .first()
+    )
     if user and user.check_password(data.get('password')):
+        # Migrate hashes made with older parameters while we have the password
+        if user.password_needs_rehash():
+            user.set_password(data.get('password'))
+            db.session.commit()
         login_user(user, remember=data.get('remember-me', False))
         return jsonify({"message": "Login successful"}), 200
     return jsonify({"message": "Invalid username or password."}), 401
@@ -68,7 +79,7 @@ def user_info():
 def forgot_password():
     """Generate password reset token for user."""
     data = request.get_json()
-    user = User.query.filter_by(username=data.get('username')).first()
+    user = User.query.options(load_only(User.id)).filter_by(username=data.get('username')).first()
     if user:
         token = secrets.token_urlsafe(32)
         user.reset_token = token
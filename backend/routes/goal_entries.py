@@ -8,53 +8,184 @@ Handles:
 - Squad-wide goal entry views
 """
 
-from datetime import datetime
-from flask import Blueprint, request, jsonify
+import heapq
+import logging
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_login import login_required, current_user
-from collections import defaultdict
+from sqlalchemy import and_, case, false, func, or_
+from sqlalchemy.orm import contains_eager
 
-from models import db, User, Goal, GoalEntry, GoalGroup
+from models import db, Goal, GoalEntry, GoalGroup
 from decorators import squad_member_required
 from utils import (
     validate_boundary_value,
-    get_goal_entries,
+    get_goal_entry_dicts,
+    get_squad_goal_ids,
     check_goal_status,
-    upsert_goal_entry,
+    upsert_goal_entries,
     parse_date_range,
-    is_boundary_valid_for_partition
+    is_boundary_valid_for_partition,
+    is_counter_partition
 )
 
 goal_entries_bp = Blueprint('goal_entries', __name__)
 
+logger = logging.getLogger(__name__)
+
 # Import constants from app context
-TIME_BASED_PARTITIONS = [
+TIME_BASED_PARTITIONS = frozenset((
     'Minute', 'Hourly', 'Daily', 'Weekly', 'BiWeekly', 'Monthly'
-]
+))
+
+
+# Fixed-length partitions, as a step in days
+PARTITION_STEP_DAYS = {
+    'Daily': 1,
+    'Weekly': 7,
+    'BiWeekly': 14
+}
 
+# Entries loaded per round trip while streaming the history
+HISTORY_BATCH_SIZE = 500
 
+# Longest boundary series matched with an IN list; longer sparse series are
+# range-filtered in SQL and aligned in Python, keeping the bound parameter
+# count well under SQLite's variable limit
+MAX_BOUNDARY_IN_PARAMS = 100
+
+
+@lru_cache(maxsize=256)
 def generate_boundary_series(start_date, end_date, partition_type):
-    """Generate a series of boundary dates based on partition type."""
-    from datetime import timedelta
-    from dateutil.relativedelta import relativedelta
-
-    boundaries = []
-    current = start_date
-
-    while current <= end_date:
-        boundaries.append(current.strftime("%Y-%m-%d"))
-
-        if partition_type == "Daily":
-            current += timedelta(days=1)
-        elif partition_type == "Weekly":
-            current += timedelta(weeks=1)
-        elif partition_type == "BiWeekly":
-            current += timedelta(weeks=2)
-        elif partition_type == "Monthly":
-            current += relativedelta(months=1)
+    """
+    Generate a series of boundary dates based on partition type.
+
+    The boundary count is computed up front and each boundary is derived
+    from start_date by index, so Monthly series keep the start's day of
+    month (clamped in shorter months) rather than drifting after one.
+
+    Cached, since every history request for a group asks for the same
+    series until the day rolls over; the result is a tuple so callers
+    can't mutate the shared copy.
+    """
+    if start_date > end_date:
+        return ()
+
+    first = start_date.date() if isinstance(start_date, datetime) else start_date
+
+    step_days = PARTITION_STEP_DAYS.get(partition_type)
+    if step_days is not None:
+        step = timedelta(days=step_days)
+        count = (end_date - start_date) // step + 1
+        return tuple((first + step * i).isoformat() for i in range(count))
+
+    if partition_type == "Monthly":
+        months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+        if start_date + relativedelta(months=months) > end_date:
+            months -= 1
+        return tuple((first + relativedelta(months=i)).isoformat() for i in range(months + 1))
+
+    raise ValueError(f"Unsupported partition type: {partition_type}")
+
+
+def date_boundaries_for_group(goal_group, today):
+    """
+    Return the boundaries a time-based group has produced up to today.
+
+    Returns None when no bounded series can be derived (missing start/end
+    date or a partition type without a fixed step), in which case the
+    recorded boundaries are used as-is.
+    """
+    if goal_group.start_date is None or goal_group.end_date is None:
+        return None
+    if goal_group.start_date > today:
+        # Start date is in the future, no history to show
+        return ()
+    try:
+        return generate_boundary_series(
+            goal_group.start_date,
+            min(goal_group.end_date, today),
+            goal_group.partition_type
+        )
+    except ValueError:
+        return None
+
+
+def partition_metadata(goal_group):
+    """
+    Return (partition_type, start_value, is_counter) for a goal group.
+
+    start_value is the counter start for counter groups and the ISO start
+    date otherwise.
+    """
+    if goal_group is None:
+        return None, None, False
+
+    partition_type = goal_group.partition_type
+    is_counter = is_counter_partition(partition_type)
+    if is_counter:
+        start_value = goal_group.start_value
+    else:
+        start_value = goal_group.start_date.isoformat() if goal_group.start_date else None
+    return partition_type, start_value, is_counter
+
+
+def valid_boundary_filter(squad_id, group_id=None):
+    """
+    Build the SQL filter restricting goal entries to valid partition boundaries.
+
+    Each group's boundary series is resolved once. Daily series accept every
+    date, so they are filtered as a BETWEEN range; sparser series (Weekly,
+    Monthly, ...) are matched with IN, so misaligned entries (e.g. a
+    non-Monday entry in a Weekly group) are filtered out by the database.
+    Sparse series longer than MAX_BOUNDARY_IN_PARAMS are only range-limited,
+    so a long-running group doesn't bind thousands of parameters; like
+    groups without a bounded series (counters, open-ended dates), their
+    entries must be checked by the caller.
+
+    Returns:
+        Tuple of (series_by_group_id, unchecked_groups, filter_clause);
+        unchecked_groups maps group id to GoalGroup for the groups whose
+        boundary alignment the caller must check, and the clause expects
+        Goal to be joined to GoalEntry.
+    """
+    # End of the current UTC day, the same "today" the client and
+    # parse_date_range use, so aligned entries made today are never cut off
+    today = datetime.utcnow().replace(hour=23, minute=59, second=59, microsecond=999999)
+    groups_query = GoalGroup.query.filter_by(squad_id=squad_id)
+    if group_id:
+        groups_query = groups_query.filter_by(id=group_id)
+
+    group_series = {}
+    unchecked_groups = {}
+    group_filters = []
+    for goal_group in groups_query.all():
+        series = None
+        if not is_counter_partition(goal_group.partition_type):
+            series = date_boundaries_for_group(goal_group, today)
+
+        if series is None:
+            unchecked_groups[goal_group.id] = goal_group
+            group_filters.append(Goal.group_id == goal_group.id)
+            continue
+
+        group_series[goal_group.id] = series
+        if not series:
+            continue
+        if PARTITION_STEP_DAYS.get(goal_group.partition_type) == 1:
+            boundary_clause = GoalEntry.boundary_value.between(series[0], series[-1])
+        elif len(series) <= MAX_BOUNDARY_IN_PARAMS:
+            boundary_clause = GoalEntry.boundary_value.in_(series)
         else:
-            raise ValueError(f"Unsupported partition type: {partition_type}")
+            unchecked_groups[goal_group.id] = goal_group
+            boundary_clause = GoalEntry.boundary_value.between(series[0], series[-1])
+        group_filters.append(and_(Goal.group_id == goal_group.id, boundary_clause))
 
-    return boundaries
+    return group_series, unchecked_groups, or_(false(), *group_filters)
 
 
 @goal_entries_bp.route('/squads/<squad_id>/goals/entry', methods=['POST'])
@@ -71,31 +202,25 @@ def submit_squad_goal_entry(squad_id, squad):
     if error:
         return jsonify({"message": error}), 400
 
-    valid_goal_ids = {str(g.id) for g in Goal.query.filter_by(squad_id=squad.id).all()}
+    # Read ids up front: commit() expires loaded instances, and touching
+    # current_user or squad afterwards would re-SELECT them
+    user_id = current_user.id
+    valid_goal_ids = get_squad_goal_ids(squad.id)
 
+    upserts = []
     for goal_id_str, entry_obj in entries_data.items():
         if goal_id_str not in valid_goal_ids:
-            print(f"Skipping unknown goal ID: {goal_id_str}")
+            logger.debug("Skipping unknown goal ID: %s", goal_id_str)
             continue
 
-        value = entry_obj.get("value")
-        note = entry_obj.get("note")
-
-        # Use upsert helper
-        upsert_goal_entry(
-            current_user.id,
-            squad.id,
-            goal_id_str,
-            boundary_value_str,
-            value,
-            note
-        )
+        upserts.append((goal_id_str, entry_obj.get("value"), entry_obj.get("note")))
 
+    # One INSERT ... ON CONFLICT for the whole form
+    upsert_goal_entries(user_id, squad_id, boundary_value_str, upserts)
     db.session.commit()
 
     # Return updated entries for the boundary using query helper
-    entries = get_goal_entries(current_user.id, squad.id, boundary_value_str)
-    return jsonify([entry.to_dict() for entry in entries]), 200
+    return jsonify(get_goal_entry_dicts(user_id, squad_id, boundary_value_str)), 200
 
 
 @goal_entries_bp.route("/squads/<squad_id>/goals/entry", methods=['GET'])
@@ -111,8 +236,7 @@ def get_user_goal_entry_for_date(squad_id, squad):
         return jsonify({"message": "Boundary value (date or counter) parameter is required"}), 400
 
     # Use query helper
-    entries = get_goal_entries(current_user.id, squad.id, boundary_value_str)
-    return jsonify([entry.to_dict() for entry in entries]), 200
+    return jsonify(get_goal_entry_dicts(current_user.id, squad.id, boundary_value_str)), 200
 
 
 @goal_entries_bp.route("/squads/<squad_id>/goals/history", methods=["GET"])
@@ -125,223 +249,282 @@ def get_goal_history(squad_id, squad, group_id=None):
     filling missing boundaries up to the latest recorded entry.
     Entries are returned in chronological order (oldest → newest).
     Supports pagination with page and page_size query parameters.
+
+    The response is streamed one goal at a time: entries are read in goal
+    order, so each goal's history is built, encoded and released before the
+    next goal's entries are loaded.
     """
     # Get pagination parameters
     page = request.args.get('page', 0, type=int)
     page_size = request.args.get('page_size', 7, type=int)
 
+    # Read up front; the body is generated after the view returns
+    user_id = current_user.id
+
+    group_series, unchecked_groups, boundary_filter = valid_boundary_filter(squad_id, group_id)
+
+    # The boundary filter only admits goals in one of the squad's groups, so
+    # inner joins lose nothing and let each entry arrive with its goal and group
     query = (
         GoalEntry.query
-        .join(Goal)
+        .join(GoalEntry.goal)
+        .join(Goal.goal_group)
+        .options(contains_eager(GoalEntry.goal).contains_eager(Goal.goal_group))
         .filter(
-            GoalEntry.user_id == current_user.id,
-            GoalEntry.squad_id == squad_id
+            GoalEntry.user_id == user_id,
+            GoalEntry.squad_id == squad_id,
+            boundary_filter
         )
+        # Each goal's entries must be contiguous to be built one goal at a
+        # time, and goals are emitted in this order
+        .order_by(GoalEntry.goal_id)
+        .yield_per(HISTORY_BATCH_SIZE)
     )
 
-    if group_id:
-        query = query.filter(Goal.group_id == group_id)
-
-    entries = query.all()
-    if not entries:
-        return jsonify({
-            "user_id": current_user.id,
-            "squad_id": squad_id,
-            "groups": [],
-            "total_pages": 0
-        }), 200
-
-    grouped = defaultdict(lambda: {
-        "goal_id": None,
-        "goal_name": None,
-        "goal_type": None,
-        "goal_target": None,
-        "goal_target_max": None,
-        "partition_type": None,
-        "start_value": None,
-        "boundaries": {}
-    })
-
-    # --- Step 1: Collect all entries and goal metadata, filtering by valid boundaries ---
-    for entry in entries:
-        goal = entry.goal
-        if not goal:
-            continue
-        gid = goal.id
-
-        if grouped[gid]["goal_id"] is None:
-            grouped[gid]["goal_id"] = gid
-            grouped[gid]["goal_name"] = goal.name
-            grouped[gid]["goal_type"] = goal.type
-            grouped[gid]["goal_target"] = goal.target
-            grouped[gid]["goal_target_max"] = goal.target_max
-            grouped[gid]["partition_type"] = goal.goal_group.partition_type if goal.goal_group else None
-
-            # Safely extract start_value based on partition type
-            if goal.goal_group:
-                partition_type_str = str(goal.goal_group.partition_type).lower() if goal.goal_group.partition_type else ""
-                if "counter" in partition_type_str:
-                    grouped[gid]["start_value"] = goal.goal_group.start_value
-                else:
-                    grouped[gid]["start_value"] = goal.goal_group.start_date.isoformat() if goal.goal_group.start_date else None
-            else:
-                grouped[gid]["start_value"] = None
+    # Partition metadata, configured counter ranges and series membership
+    # sets are resolved once per group and shared by its goals
+    group_cache = {"meta": {}, "counter_series": {}, "series_sets": {}}
+
+    def goal_histories():
+        for _, goal_entries in groupby(query, key=attrgetter("goal_id")):
+            yield build_goal_history(
+                list(goal_entries), page, page_size,
+                group_series, unchecked_groups, group_cache
+            )
+
+    return Response(
+        stream_with_context(stream_history_json(user_id, squad_id, goal_histories())),
+        mimetype="application/json"
+    )
 
-        # FILTER: Only include entries with boundaries valid for current partition type
-        partition_type = grouped[gid]["partition_type"]
-        start_value = grouped[gid]["start_value"]
 
-        if not is_boundary_valid_for_partition(
-            str(entry.boundary_value),
-            partition_type,
-            start_value
-        ):
+def build_goal_history(entries, page, page_size, group_series, unchecked_groups, group_cache):
+    """
+    Build one goal's history page from its entries.
+
+    Args:
+        entries: The goal's entries, with goal and goal group loaded
+        page: Page number, 0 being the newest boundaries
+        page_size: Boundaries per page
+        group_series: Boundary series by group id, from valid_boundary_filter
+        unchecked_groups: Groups whose alignment must be checked here
+        group_cache: Per-request dicts of values shared by a group's goals
+
+    Returns:
+        Goal history dict with the page's boundaries and total_pages
+    """
+    goal = entries[0].goal
+    goal_group = goal.goal_group
+
+    group_meta = group_cache["meta"]
+    if goal_group.id not in group_meta:
+        group_meta[goal_group.id] = partition_metadata(goal_group)
+    partition_type, start_value, is_counter = group_meta[goal_group.id]
+
+    goal_data = {
+        "goal_id": goal.id,
+        "goal_name": goal.name,
+        "goal_type": goal.type,
+        "goal_target": goal.target,
+        "goal_target_max": goal.target_max,
+        "partition_type": partition_type,
+        "start_value": start_value
+    }
+
+    # --- Step 1: Collect entries, filtering by valid boundaries ---
+    stored = {}
+    check_alignment = goal_group.id in unchecked_groups
+    for entry in entries:
+        bv = str(entry.boundary_value)
+
+        # FILTER: Groups whose alignment wasn't checked in SQL (counters,
+        # open-ended dates, long sparse series) are checked here
+        if check_alignment and not is_boundary_valid_for_partition(bv, partition_type, start_value):
             # Skip this entry - it doesn't align with the current partition type
             continue
 
-        # Calculate status using check_goal_status
-        status = check_goal_status(
-            goal.type,
-            goal.target,
-            goal.target_max,
-            entry.value
-        )
-
-        grouped[gid]["boundaries"][str(entry.boundary_value)] = {
+        stored[bv] = {
             "entry_id": entry.id,
-            "boundary": str(entry.boundary_value),
+            "boundary": bv,
             "value": entry.value,
             "note": entry.note,
-            "status": status
+            "status": check_goal_status(goal.type, goal.target, goal.target_max, entry.value)
         }
 
-    # --- Step 2: Generate boundary lists from group start/end dates ---
-    # All goals in the same group should share the same boundary range
-    for goal_data in grouped.values():
-        # Skip if this goal has no group information
-        if goal_data["goal_id"] is None:
-            continue
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processing goal %r: partition_type=%s is_counter=%s start=%s end=%s",
+            goal.name, partition_type, is_counter, start_value,
+            goal_group.end_value if is_counter else goal_group.end_date
+        )
 
-        # Get the goal's group to access start/end dates
-        goal = Goal.query.get(goal_data["goal_id"])
-        if not goal or not goal.goal_group:
-            continue
+    # --- Step 2: Generate the boundary list from group start/end ---
+    # All goals in the same group share the same boundary range
+    counter_series = group_cache["counter_series"]
+    if is_counter and goal_group.id in counter_series:
+        all_boundaries = counter_series[goal_group.id]
+    elif is_counter:
+        try:
+            start = int(start_value or goal_group.start_value or 1)
+
+            # If no end_value is configured, use the maximum boundary from existing entries
+            if goal_group.end_value is not None:
+                end = int(goal_group.end_value)
+            else:
+                # Use the max boundary from existing entries, or default to start
+                existing_boundaries = [int(b) for b in stored if b.isdigit()]
+                end = max(existing_boundaries) if existing_boundaries else start
+
+            all_boundaries = [str(i) for i in range(start, end + 1)]
+            if goal_group.end_value is not None:
+                # A configured range is the same for every goal in the group
+                counter_series[goal_group.id] = all_boundaries
+            logger.debug("Counter boundaries: %s to %s (%d total)", start, end, len(all_boundaries))
+        except (ValueError, TypeError) as e:
+            # If conversion fails, use existing boundaries only
+            logger.warning("Cannot parse counter values for goal %r: %s", goal.name, e)
+            all_boundaries = sorted(stored)
+            is_counter = False
+    else:
+        all_boundaries = group_series.get(goal_group.id)
+        if all_boundaries is None:
+            # No bounded series for this group, use only existing boundaries
+            all_boundaries = sorted(stored)
+        logger.debug("Date boundaries: %d total", len(all_boundaries))
+
+    # Walk the generated series (already ascending) once, filling gaps
+    # with blanks. Stored boundaries outside the series are rare, so only
+    # those need sorting before being merged in.
+    boundaries_ordered = [
+        (boundary, stored.get(boundary) or {
+            "entry_id": None,
+            "boundary": boundary,
+            "value": None,
+            "note": None,
+            "status": "blank"
+        })
+        for boundary in all_boundaries
+    ]
+
+    # Membership sets for series shared by every goal in a group, so each
+    # group's set is built once rather than once per goal
+    series_sets = group_cache["series_sets"]
+    shared = goal_group.id in group_series or goal_group.id in counter_series
+    series = series_sets.get(goal_group.id) if shared else None
+    if series is None:
+        series = frozenset(all_boundaries)
+        if shared:
+            series_sets[goal_group.id] = series
+    extras = [item for item in stored.items() if item[0] not in series]
+    if extras:
+        if is_counter:
+            sort_key = lambda item: int(item[0])
+        else:
+            # Zero-padded YYYY-MM-DD strings already sort chronologically
+            sort_key = itemgetter(0)
+        extras.sort(key=sort_key)
+        boundaries_ordered = list(heapq.merge(boundaries_ordered, extras, key=sort_key))
 
-        goal_group = goal.goal_group
-        partition_type = goal_data["partition_type"]
-        start_value = goal_data["start_value"]
+    # --- Step 3: Apply pagination ---
+    total_boundaries = len(boundaries_ordered)
+    total_pages = (total_boundaries + page_size - 1) // page_size if page_size > 0 else 1
 
-        is_counter = partition_type is not None and "counter" in str(partition_type).lower()
+    # Page 0 = newest entries, so slice back from the tail
+    end_idx = max(0, total_boundaries - page * page_size)
+    start_idx = max(0, end_idx - page_size)
+    goal_data["boundaries"] = dict(boundaries_ordered[start_idx:end_idx])
+    goal_data["total_pages"] = total_pages
+    return goal_data
 
-        # DEBUG: Log partition detection
-        print(f"\n=== Processing goal: {goal_data.get('goal_name')} ===")
-        print(f"Partition type: {partition_type}")
-        print(f"Is counter: {is_counter}")
-        print(f"Start value: {start_value}")
-        print(f"Group end value: {goal_group.end_value if is_counter else goal_group.end_date}")
 
-        # Store is_counter flag for use in pagination step
-        goal_data["is_counter"] = is_counter
+def stream_history_json(user_id, squad_id, groups):
+    """
+    Yield the history response body one goal group at a time.
 
-        # Generate all boundaries from group start to group end
-        if is_counter:
-            try:
-                start = int(start_value or goal_group.start_value or 1)
-
-                # If no end_value is configured, use the maximum boundary from existing entries
-                if goal_group.end_value is not None:
-                    end = int(goal_group.end_value)
-                else:
-                    # Use the max boundary from existing entries, or default to start
-                    existing_boundaries = [int(b) for b in goal_data["boundaries"].keys() if b.isdigit()]
-                    end = max(existing_boundaries) if existing_boundaries else start
-
-                all_boundaries = [str(i) for i in range(start, end + 1)]
-                print(f"Counter boundaries: {start} to {end} ({len(all_boundaries)} total)")
-            except (ValueError, TypeError) as e:
-                # If conversion fails, use existing boundaries only
-                print(f"ERROR: Cannot parse counter values for goal '{goal_data.get('goal_name')}': {e}")
-                all_boundaries = sorted(goal_data["boundaries"].keys())
-                is_counter = False
-                goal_data["is_counter"] = False
+    Each group is encoded as soon as it is built, so large histories are
+    never held in memory at once. The response's total_pages is the first
+    group's (0 without groups), and is written after the groups. Keys are
+    emitted in sorted order and compact to match jsonify() output.
+    """
+    dumps = partial(current_app.json.dumps, separators=(",", ":"))
+    total_pages = 0
+    yield '{"groups":['
+    for i, group in enumerate(groups):
+        if i:
+            yield ','
         else:
-            try:
-                start_date = datetime.fromisoformat(start_value)
-                # Use group's end_date, but cap at today's date to exclude future dates
-                end_date = goal_group.end_date
-                today = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
-
-                if end_date:
-                    # Use the earlier of: group end date or today
-                    effective_end_date = min(end_date, today)
-
-                    # Only generate boundaries if start is not in the future
-                    if start_date <= today:
-                        all_boundaries = generate_boundary_series(start_date, effective_end_date, partition_type)
-                        print(f"Date boundaries: {start_date.date()} to {effective_end_date.date()} ({len(all_boundaries)} total)")
-                    else:
-                        # Start date is in the future, no history to show
-                        all_boundaries = []
-                        print(f"Start date {start_date.date()} is in the future - no boundaries to display")
-                else:
-                    # No end date specified, use only existing boundaries
-                    all_boundaries = sorted(goal_data["boundaries"].keys())
-                    print(f"No end date - using {len(all_boundaries)} existing boundaries")
-            except (ValueError, TypeError) as e:
-                print(f"ERROR: Cannot parse dates for goal '{goal_data.get('goal_name')}': {e}")
-                all_boundaries = sorted(goal_data["boundaries"].keys())
-
-        # Fill missing boundaries with blanks
-        for boundary in all_boundaries:
-            if boundary not in goal_data["boundaries"]:
-                goal_data["boundaries"][boundary] = {
-                    "entry_id": None,
-                    "boundary": boundary,
-                    "value": None,
-                    "note": None,
-                    "status": "blank"
-                }
-
-        # Sort by boundary ascending (latest last)
-        goal_data["boundaries"] = dict(sorted(
-            goal_data["boundaries"].items(),
-            key=lambda x: (
-                int(x[0]) if is_counter else datetime.fromisoformat(x[0])
-            )
-        ))
+            total_pages = group["total_pages"]
+        yield dumps(group)
+    yield f'],"squad_id":{dumps(squad_id)},"total_pages":{dumps(total_pages)},"user_id":{dumps(user_id)}}}\n'
 
-    # --- Step 3: Apply pagination ---
-    for goal_data in grouped.values():
-        all_boundary_keys = list(goal_data["boundaries"].keys())
-        total_boundaries = len(all_boundary_keys)
-        total_pages = (total_boundaries + page_size - 1) // page_size if page_size > 0 else 1
 
-        # Calculate slice indices (newest first, so reverse)
-        # Page 0 = newest entries
-        all_boundary_keys.reverse()
-        start_idx = page * page_size
-        end_idx = start_idx + page_size
-        paginated_keys = all_boundary_keys[start_idx:end_idx]
+@goal_entries_bp.route("/squads/<squad_id>/goals/summary", methods=["GET"])
+@goal_entries_bp.route("/squads/<squad_id>/goals/summary/<group_id>", methods=["GET"])
+@login_required
+@squad_member_required
+def get_goal_summary(squad_id, squad, group_id=None):
+    """
+    Returns met/unmet/blank counts per goal for the current user's entries.
 
-        # Filter boundaries to only include paginated keys
-        goal_data["boundaries"] = {k: goal_data["boundaries"][k] for k in reversed(paginated_keys) if k in goal_data["boundaries"]}
-        goal_data["total_pages"] = total_pages
+    Entries are aggregated in SQL by (goal, value), so status is evaluated
+    once per distinct value instead of once per entry and no entry rows are
+    loaded into Python. Groups whose boundaries the filter can't align in SQL
+    (counters, open-ended dates, long sparse series) are also split by
+    boundary, so misaligned entries are skipped as in the history.
+    """
+    _, unchecked_groups, boundary_filter = valid_boundary_filter(squad_id, group_id)
 
-        # Clean up temporary flag (only if it exists)
-        if "is_counter" in goal_data:
-            del goal_data["is_counter"]
+    # NULL for groups aligned in SQL, so their rows still collapse by value
+    unchecked_boundary = case(
+        (Goal.group_id.in_(list(unchecked_groups)), GoalEntry.boundary_value),
+        else_=None
+    )
 
-    response_groups = list(grouped.values())
+    rows = (
+        db.session.query(
+            Goal.id, Goal.name, Goal.type, Goal.target, Goal.target_max,
+            Goal.group_id, unchecked_boundary, GoalEntry.value, func.count()
+        )
+        .select_from(GoalEntry)
+        .join(Goal)
+        .filter(
+            GoalEntry.user_id == current_user.id,
+            GoalEntry.squad_id == squad_id,
+            boundary_filter
+        )
+        .group_by(
+            Goal.id, Goal.name, Goal.type, Goal.target, Goal.target_max,
+            Goal.group_id, unchecked_boundary, GoalEntry.value
+        )
+        .all()
+    )
 
-    # Get total pages from first group (all should be same)
-    total_pages = response_groups[0]["total_pages"] if response_groups else 0
+    summaries = {}
+    group_meta = {}
+    for goal_id, name, goal_type, target, target_max, goal_group_id, boundary, value, count in rows:
+        if boundary is not None:
+            if goal_group_id not in group_meta:
+                group_meta[goal_group_id] = partition_metadata(unchecked_groups[goal_group_id])
+            partition_type, start_value, _ = group_meta[goal_group_id]
+            if not is_boundary_valid_for_partition(boundary, partition_type, start_value):
+                continue
+
+        summary = summaries.get(goal_id)
+        if summary is None:
+            summary = summaries[goal_id] = {
+                "goal_id": goal_id,
+                "goal_name": name,
+                "met": 0,
+                "unmet": 0,
+                "blank": 0
+            }
+        summary[check_goal_status(goal_type, target, target_max, value)] += count
 
     return jsonify({
         "user_id": current_user.id,
         "squad_id": squad_id,
-        "groups": response_groups,
-        "total_pages": total_pages
-    })
+        "goals": list(summaries.values())
+    }), 200
 
 
 @goal_entries_bp.route('/squads/<squad_id>/goals/entries/day', methods=['GET'])
@@ -368,31 +551,31 @@ def get_squad_entries_for_day(squad_id, squad):
 
     entries = (
         GoalEntry.query
-        .join(User)
+        .join(GoalEntry.user)
         .join(Goal)
         .join(GoalGroup)
+        .options(contains_eager(GoalEntry.user))
         .filter(
             GoalEntry.squad_id == squad.id,
             GoalGroup.partition_type.in_(TIME_BASED_PARTITIONS),
             GoalEntry.boundary_value.between(start_date_str, end_date_str)
         )
+        .order_by(GoalEntry.user_id, GoalEntry.boundary_value)
         .all()
     )
 
-    grouped = {}
-    for entry in entries:
-        user_id = entry.user.id
-        date_key = entry.boundary_value
-        if user_id not in grouped:
-            grouped[user_id] = {
-                "user_id": user_id,
-                "username": entry.user.username,
-                "entries": {}
+    # Rows arrive sorted by (user, boundary), so each group is one contiguous run
+    grouped = []
+    for _, user_entries in groupby(entries, key=attrgetter("user_id")):
+        user_entries = list(user_entries)
+        user = user_entries[0].user
+        grouped.append({
+            "user_id": user.id,
+            "username": user.username,
+            "entries": {
+                boundary: [entry.to_dict() for entry in day_entries]
+                for boundary, day_entries in groupby(user_entries, key=attrgetter("boundary_value"))
             }
+        })
 
-        if date_key not in grouped[user_id]["entries"]:
-            grouped[user_id]["entries"][date_key] = []
-
-        grouped[user_id]["entries"][date_key].append(entry.to_dict())
-
-    return jsonify(list(grouped.values())), 200
+    return jsonify(grouped), 200
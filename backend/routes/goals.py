@@ -8,26 +8,21 @@ Handles:
 
 from flask import Blueprint, request, jsonify
 from flask_login import login_required
+from sqlalchemy.orm import joinedload
 
 from models import db, Goal, GlobalGoal, GoalGroup
 from decorators import squad_member_required, squad_admin_required
-from utils import validate_partition_data
+from utils import validate_partition_data, get_goal_group_dicts, invalidate_squad_goal_cache
 
 goals_bp = Blueprint('goals', __name__)
 
-# Valid partition types - imported from app context
-VALID_PARTITION_TYPES = [
-    'Minute', 'Hourly', 'Daily', 'Weekly', 'BiWeekly', 'Monthly', 'CustomCounter'
-]
-
 
 @goals_bp.route("/squads/<squad_id>/groups", methods=["GET"])
 @login_required
 @squad_member_required
 def get_goal_groups(squad_id, squad):
     """Retrieve all goal groups for a squad."""
-    groups = GoalGroup.query.filter_by(squad_id=squad_id).all()
-    return jsonify([group.to_dict() for group in groups])
+    return jsonify(get_goal_group_dicts(squad_id))
 
 
 @goals_bp.route("/squads/<squad_id>/groups", methods=["POST"])
@@ -45,7 +40,7 @@ def create_goal_group(squad_id, squad):
         return jsonify({"error": "Missing required group fields (group_name, partition_type)"}), 400
 
     # Validate partition data using helper
-    validated_data, error = validate_partition_data(partition_type, data, VALID_PARTITION_TYPES)
+    validated_data, error = validate_partition_data(partition_type, data)
     if error:
         return jsonify({"error": error}), 400
 
@@ -67,6 +62,7 @@ def create_goal_group(squad_id, squad):
     group.end_date = validated_data['end_date']
 
     db.session.commit()
+    invalidate_squad_goal_cache(squad_id)
 
     return jsonify(group.to_dict()), 201 if not group_id else 200
 
@@ -81,6 +77,7 @@ def delete_goal_group(squad_id, squad, group_id):
     # The 'cascade="all, delete-orphan"' handles deletion of related Goals and Entries.
     db.session.delete(group)
     db.session.commit()
+    invalidate_squad_goal_cache(squad_id)
 
     return jsonify({"message": f"Goal Group {group_id} and all contained goals deleted"}), 200
 
@@ -90,8 +87,13 @@ def delete_goal_group(squad_id, squad, group_id):
 @squad_member_required
 def get_goals(squad_id, squad):
     """Get all goals for a squad."""
-    goals = [goal.to_dict() for goal in squad.goals]
-    return jsonify(goals)
+    goals = (
+        Goal.query
+        .options(joinedload(Goal.goal_group), joinedload(Goal.global_goal))
+        .filter_by(squad_id=squad_id)
+        .all()
+    )
+    return jsonify([goal.to_dict() for goal in goals])
 
 
 @goals_bp.route("/squads/<squad_id>/goals", methods=["POST"])
@@ -154,6 +156,8 @@ def update_goals(squad_id, squad):
         goal.target_max = g_data.get("target_max")
 
     db.session.commit()
+    if not goal_id:
+        invalidate_squad_goal_cache(squad_id)
 
     return jsonify([goal.to_dict()]), 200
 
@@ -167,5 +171,6 @@ def delete_goal(squad_id, squad, goal_id):
 
     db.session.delete(goal)
     db.session.commit()
+    invalidate_squad_goal_cache(squad_id)
 
     return jsonify({"message": f"Goal {goal_id} deleted"}), 200
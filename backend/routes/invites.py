@@ -9,8 +9,9 @@ Handles:
 
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
 
-from models import db, User, Squad, SquadInvite, SquadMember
+from models import db, Squad, SquadInvite, SquadMember
 
 invites_bp = Blueprint('invites', __name__)
 
@@ -31,11 +32,16 @@ def get_invites():
         if not squad or squad.admin.id != current_user.id:
             return jsonify({"error": "Unauthorized access or squad not found."}), 403
 
-        outbound_invites = SquadInvite.query.filter_by(squad_id=squad_id, status='pending').all()
+        outbound_invites = (
+            SquadInvite.query
+            .options(joinedload(SquadInvite.invited_user))
+            .filter_by(squad_id=squad_id, status='pending')
+            .all()
+        )
 
         result = []
         for i in outbound_invites:
-            invited_user = User.query.get(i.invited_user_id)
+            invited_user = i.invited_user
 
             result.append({
                 "id": i.id,
@@ -48,7 +54,12 @@ def get_invites():
         return jsonify(result)
 
     # User view: Get all pending invites received by the current user
-    invites = SquadInvite.query.filter_by(invited_user_id=current_user.id, status='pending').all()
+    invites = (
+        SquadInvite.query
+        .options(joinedload(SquadInvite.squad).joinedload(Squad.admin))
+        .filter_by(invited_user_id=current_user.id, status='pending')
+        .all()
+    )
     result = []
     for i in invites:
         if i.squad:
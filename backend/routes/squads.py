@@ -9,10 +9,12 @@ Handles:
 
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 
-from models import db, User, UserProfile, Squad, SquadMember, SquadInvite
+from models import db, User, UserProfile, Squad, SquadMember, SquadInvite, Goal, GoalGroup, GoalEntry
 from decorators import squad_member_required, squad_admin_required
-from utils import get_user_by_username
+from utils import get_user_by_username, invalidate_squad_goal_cache
 
 squads_bp = Blueprint('squads', __name__)
 
@@ -24,26 +26,45 @@ def create_squad():
     data = request.get_json()
     name = data.get('name')
 
-    if Squad.query.filter_by(name=name).first():
+    if db.session.query(Squad.query.filter_by(name=name).exists()).scalar():
         return jsonify({"message": "Squad name already taken"}), 400
 
-    squad = Squad(name=name, admin_id=current_user.id)
+    # Read before commit() expires current_user and forces a re-SELECT
+    user_id = current_user.id
+
+    squad = Squad(name=name, admin_id=user_id)
     db.session.add(squad)
-    db.session.commit()
+    db.session.flush()
+    squad_id = squad.id
 
-    # Auto-add creator as member
-    membership = SquadMember(squad_id=squad.id, user_id=current_user.id)
+    # Auto-add creator as member in the same transaction
+    membership = SquadMember(squad_id=squad_id, user_id=user_id)
     db.session.add(membership)
     db.session.commit()
 
-    return jsonify({"message": "Squad created!", "squad_id": squad.id}), 201
+    return jsonify({"message": "Squad created!", "squad_id": squad_id}), 201
 
 
 @squads_bp.route('/squads', methods=['GET'])
 @login_required
 def get_user_squads():
     """Get all squads for the current user."""
-    squads = current_user.squads
+    squads = (
+        Squad.query
+        .join(SquadMember, SquadMember.squad_id == Squad.id)
+        .filter(SquadMember.user_id == current_user.id)
+        .options(joinedload(Squad.admin))
+        .all()
+    )
+
+    # Count members for all squads at once instead of loading each roster
+    member_counts = dict(
+        db.session.query(SquadMember.squad_id, func.count(SquadMember.user_id))
+        .filter(SquadMember.squad_id.in_([squad.id for squad in squads]))
+        .group_by(SquadMember.squad_id)
+        .all()
+    )
+
     result = []
     for squad in squads:
         result.append({
@@ -51,7 +72,7 @@ def get_user_squads():
             "name": squad.name,
             "admin": squad.admin.username,
             "is_admin": squad.admin_id == current_user.id,
-            "members": len(squad.members)
+            "members": member_counts.get(squad.id, 0)
         })
     return jsonify(result), 200
 
@@ -79,12 +100,13 @@ def get_squad(squad_id, squad):
 @squad_admin_required
 def delete_squad(squad_id, squad):
     """Delete a squad (admin only)."""
-    SquadMember.query.filter_by(squad_id=squad.id).delete()
-    SquadInvite.query.filter_by(squad_id=squad.id).delete()
-
-    # Deletion of Goals, GoalGroups, and GoalEntries is handled by cascade delete on the Squad model
-    db.session.delete(squad)
+    # Bulk deletes, children before parents, instead of the ORM cascade
+    # loading every goal and entry just to delete them one at a time
+    for model in (GoalEntry, Goal, GoalGroup, SquadMember, SquadInvite):
+        model.query.filter_by(squad_id=squad_id).delete(synchronize_session=False)
+    Squad.query.filter_by(id=squad_id).delete(synchronize_session=False)
     db.session.commit()
+    invalidate_squad_goal_cache(squad_id)
 
     return jsonify({"message": "Squad deleted"}), 200
 
@@ -94,25 +116,22 @@ def delete_squad(squad_id, squad):
 @squad_member_required
 def squad_profiles(squad_id, squad):
     """Get profiles for all squad members."""
-    member_usernames = [member.username for member in squad.members]
-    users = User.query.filter(User.username.in_(member_usernames)).all()
-    user_ids = [u.id for u in users]
-
-    profiles = UserProfile.query.filter(UserProfile.user_id.in_(user_ids)).all()
-
-    profile_data_list = []
-
-    user_map = {u.id: u.username for u in users}
-    profile_map = {p.user_id: p.name for p in profiles}
-
-    for user_id, username in user_map.items():
-        configured_name = profile_map.get(user_id)
-
-        profile_entry = {
+    rows = (
+        db.session.query(User.username, UserProfile.name)
+        .select_from(SquadMember)
+        .join(User, User.id == SquadMember.user_id)
+        .outerjoin(UserProfile, UserProfile.user_id == User.id)
+        .filter(SquadMember.squad_id == squad_id)
+        .all()
+    )
+
+    profile_data_list = [
+        {
             "username": username,
             "configured_name": configured_name if configured_name else None
         }
-        profile_data_list.append(profile_entry)
+        for username, configured_name in rows
+    ]
 
     return jsonify(profile_data_list), 200
 
@@ -129,13 +148,18 @@ def invite_user(squad_id, squad):
     if error:
         return error
 
-    if user in squad.members:
+    is_member = db.session.query(
+        SquadMember.query.filter_by(squad_id=squad.id, user_id=user.id).exists()
+    ).scalar()
+    if is_member:
         return jsonify({"message": f"{username} is already a member of this squad."}), 400
 
-    existing_invite = SquadInvite.query.filter_by(
-        squad_id=squad.id, invited_user_id=user.id, status="pending"
-    ).first()
-    if existing_invite:
+    has_pending_invite = db.session.query(
+        SquadInvite.query.filter_by(
+            squad_id=squad.id, invited_user_id=user.id, status="pending"
+        ).exists()
+    ).scalar()
+    if has_pending_invite:
         return jsonify({"message": "User already invited"}), 400
 
     invite = SquadInvite(squad_id=squad.id, invited_user_id=user.id)
@@ -228,3 +252,48 @@ def remove_member(squad_id, squad):
 
     db.session.commit()
     return jsonify({"message": f"{username_to_remove} has been removed from the squad"}), 200
+
+
+@squads_bp.route('/squads/<squad_id>/members/bulk_delete', methods=['POST'])
+@login_required
+@squad_admin_required
+def bulk_delete_members(squad_id, squad):
+    """Remove several members and their pending invites in one commit (admin only)."""
+    data = request.get_json()
+    usernames = data.get("usernames")
+
+    if not isinstance(usernames, list) or not usernames:
+        return jsonify({"message": "usernames must be a non-empty list"}), 400
+
+    if squad.admin.username in usernames:
+        return jsonify({"message": "Cannot remove the squad administrator"}), 400
+
+    members = (
+        db.session.query(User.id, User.username)
+        .join(SquadMember, SquadMember.user_id == User.id)
+        .filter(SquadMember.squad_id == squad_id, User.username.in_(usernames))
+        .all()
+    )
+    if not members:
+        return jsonify({"message": "None of the given users are members of this squad"}), 404
+
+    user_ids = [user_id for user_id, _ in members]
+
+    SquadMember.query.filter(
+        SquadMember.squad_id == squad_id,
+        SquadMember.user_id.in_(user_ids)
+    ).delete(synchronize_session=False)
+
+    SquadInvite.query.filter(
+        SquadInvite.squad_id == squad_id,
+        SquadInvite.invited_user_id.in_(user_ids),
+        SquadInvite.status == 'pending'
+    ).delete(synchronize_session=False)
+
+    db.session.commit()
+
+    removed = sorted(username for _, username in members)
+    return jsonify({
+        "message": f"Removed {len(removed)} member(s) from the squad",
+        "removed": removed
+    }), 200
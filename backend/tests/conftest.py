@@ -2,51 +2,108 @@
 Pytest configuration and fixtures for Squad Goals tests.
 
 This module provides common test fixtures including:
-- Flask app with test configuration
-- Test database setup and teardown
+- Flask app with test configuration, built once per test session
+- Class-wide outer transaction, with a per-test SAVEPOINT rolled back on
+  teardown
 - Test client for API requests
 - Sample test data
 """
 
+import functools
 import pytest
-import sys
-import os
-import tempfile
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import Session, configure_mappers, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from models import db as _db, User, Squad, SquadMember
+from extensions import cache
+from json_provider import OrjsonProvider
 from flask_login import LoginManager
 from flask_cors import CORS
 
 
-@pytest.fixture(scope='function')
-def app():
+def _enable_sqlite_savepoints(engine):
+    """
+    Let pysqlite run SAVEPOINTs inside an explicit outer transaction.
+
+    pysqlite otherwise manages transactions itself and never emits BEGIN,
+    so a released SAVEPOINT would commit instead of nesting.
+
+    Args:
+        engine: SQLAlchemy engine for the test database
+    """
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def _set_sqlite_pragmas(engine):
     """
-    Create and configure a Flask app instance for testing.
+    Turn off SQLite durability work the throwaway test database doesn't need.
+
+    Args:
+        engine: SQLAlchemy engine for the test database
+    """
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_app(config_items=frozenset()):
+    """
+    Build a Flask app for testing, once per distinct configuration.
+
+    Extension setup, blueprint registration and schema creation run only on
+    the first call for a given configuration; later calls return the same app.
+
+    Args:
+        config_items: Frozen set of (key, value) config overrides applied
+            on top of the test defaults; values must be hashable
 
     Returns:
-        Flask app configured for testing
+        Flask app configured for testing, with tables created
     """
-    # Create a fresh Flask app for each test
     test_app = Flask(__name__)
 
     # Configure for testing
     test_app.config.update({
         'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        # One in-memory database shared by every connection checkout, so the
+        # fixtures and the request handlers see the same data
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'SQLALCHEMY_ENGINE_OPTIONS': {
+            'connect_args': {'check_same_thread': False},
+            'poolclass': StaticPool
+        },
         'SQLALCHEMY_TRACK_MODIFICATIONS': False,
         'WTF_CSRF_ENABLED': False,
         'SECRET_KEY': 'test-secret-key',
         'SESSION_COOKIE_HTTPONLY': True,
         'SESSION_COOKIE_SECURE': False,
-        'SESSION_COOKIE_SAMESITE': "Lax"
+        'SESSION_COOKIE_SAMESITE': "Lax",
+        'CACHE_TYPE': 'SimpleCache',
+        # Single-iteration hashing: tests exercise the login flow, not KDF cost
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1'
     })
+    test_app.config.update(dict(config_items))
+
+    # Same JSON provider as the real app; the test client's json= bodies are
+    # encoded with it too
+    test_app.json = OrjsonProvider(test_app)
 
     # Initialize extensions
     _db.init_app(test_app)
+    cache.init_app(test_app)
     login_manager = LoginManager()
     login_manager.init_app(test_app)
     CORS(test_app, supports_credentials=True)
@@ -65,28 +122,116 @@ def app():
     from routes import register_blueprints
     register_blueprints(test_app)
 
-    # Create database tables
+    # Create database tables once per app
     with test_app.app_context():
+        _enable_sqlite_savepoints(_db.engine)
+        _set_sqlite_pragmas(_db.engine)
         _db.create_all()
-        yield test_app
-        # Cleanup after each test
-        _db.session.remove()
-        _db.drop_all()
+
+    # Compile mapper relationships now rather than inside the first test
+    configure_mappers()
+
+    return test_app
+
+
+@pytest.fixture(scope='session')
+def app():
+    """
+    Provide the Flask app for testing.
+
+    Built once per test session; the schema is created once and each test
+    runs inside its own rolled-back transaction (see the db fixture).
+
+    Returns:
+        Flask app configured for testing
+    """
+    return _build_app()
+
+
+@pytest.fixture(scope='class')
+def connection(app):
+    """
+    Provide a database connection holding an outer transaction.
+
+    Class-scoped so that rows created by class-scoped fixtures are inserted
+    once and shared by every test in the class; each test nests its own
+    SAVEPOINT inside this transaction (see the db fixture). Tests outside a
+    class get a connection of their own.
+
+    Args:
+        app: Flask app fixture
+
+    Yields:
+        SQLAlchemy connection
+    """
+    with app.app_context():
+        connection = _db.engine.connect()
+    transaction = connection.begin()
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope='class')
+def class_session(app, connection):
+    """
+    Provide a session for creating class-scoped fixture data.
+
+    Commits only release a SAVEPOINT, so the rows live until the class-wide
+    transaction is rolled back. Attributes are not expired on commit, so the
+    returned objects keep their column values after the session is closed.
+
+    Args:
+        app: Flask app fixture
+        connection: Class-scoped connection fixture
+
+    Yields:
+        SQLAlchemy session bound to the class-wide connection
+    """
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    )
+    with app.app_context():
+        yield session
+    session.close()
 
 
 @pytest.fixture(scope='function')
-def db(app):
+def db(app, connection):
     """
     Provide database session with automatic rollback.
 
+    Each test gets a fresh app context and a session bound to the class-wide
+    connection inside a SAVEPOINT of its own. Commits made by the test or by
+    request handlers only release nested SAVEPOINTs, and the test's
+    SAVEPOINT is rolled back on teardown, leaving class-scoped rows intact.
+
     Args:
         app: Flask app fixture
+        connection: Class-scoped connection fixture
 
     Yields:
         Database session
     """
-    # App context is already active from app fixture
-    yield _db
+    with app.app_context():
+        savepoint = connection.begin_nested()
+
+        app_session = _db.session
+        _db.session = scoped_session(sessionmaker(
+            bind=connection,
+            join_transaction_mode="create_savepoint"
+        ))
+        cache.clear()
+
+        yield _db
+
+        _db.session.remove()
+        _db.session = app_session
+        savepoint.rollback()
 
 
 @pytest.fixture(scope='function')
@@ -104,63 +249,95 @@ def client(app, db):
     return app.test_client()
 
 
-@pytest.fixture(scope='function')
-def test_user(db):
+@pytest.fixture(scope='class')
+def test_user(class_session):
     """
-    Create a test user.
+    Create a test user, shared by the tests in a class.
 
     Args:
-        db: Database fixture
+        class_session: Class-scoped session fixture
 
     Returns:
         User object
     """
     user = User(username='testuser')
     user.set_password('testpass123')
-    db.session.add(user)
-    db.session.commit()
+    class_session.add(user)
+    class_session.commit()
     return user
 
 
 @pytest.fixture(scope='function')
-def authenticated_client(client, test_user):
+def login_as(client):
     """
-    Provide authenticated test client.
+    Provide a helper that logs a user into the test client.
+
+    Writes the Flask-Login session keys directly instead of posting to
+    /api/login, so no request or password check is needed.
 
     Args:
         client: Flask test client
+
+    Returns:
+        Function taking a User and returning the logged-in client
+    """
+    def _login_as(user):
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(user.id)
+            sess['_fresh'] = True
+        return client
+
+    return _login_as
+
+
+@pytest.fixture(scope='function')
+def logged_in_client(login_as, test_user):
+    """
+    Provide a test client logged in as the test user.
+
+    Args:
+        login_as: Login helper fixture
         test_user: Test user fixture
 
     Returns:
         Authenticated Flask test client
     """
-    # Login the test user
-    client.post('/api/login', json={
-        'username': 'testuser',
-        'password': 'testpass123'
-    })
-    return client
+    return login_as(test_user)
 
 
 @pytest.fixture(scope='function')
-def test_squad(db, test_user):
+def authenticated_client(logged_in_client):
     """
-    Create a test squad with test user as admin.
+    Provide authenticated test client.
 
     Args:
-        db: Database fixture
+        logged_in_client: Test client logged in as the test user
+
+    Returns:
+        Authenticated Flask test client
+    """
+    return logged_in_client
+
+
+@pytest.fixture(scope='class')
+def test_squad(class_session, test_user):
+    """
+    Create a test squad with test user as admin, shared by the tests in a class.
+
+    Args:
+        class_session: Class-scoped session fixture
         test_user: Test user fixture
 
     Returns:
         Squad object
     """
     squad = Squad(name='Test Squad', admin_id=test_user.id)
-    db.session.add(squad)
-    db.session.commit()
+    class_session.add(squad)
+    class_session.commit()
 
     # Add user as member
     membership = SquadMember(squad_id=squad.id, user_id=test_user.id)
-    db.session.add(membership)
-    db.session.commit()
+    class_session.add(membership)
+    class_session.commit()
 
     return squad
@@ -0,0 +1,58 @@
+"""
+Integration tests for the authentication endpoints.
+
+Other test modules log in by writing the session directly (see the
+login_as fixture); these tests go through /api/login itself.
+"""
+
+from werkzeug.security import generate_password_hash
+from models import User
+
+
+class TestLoginEndpoint:
+    """Tests for logging in through POST /api/login."""
+
+    def test_login_then_authenticated_request(self, client, test_user):
+        """Test that a correct password starts a session used by later requests."""
+        response = client.post('/api/login', json={
+            'username': 'testuser',
+            'password': 'testpass123'
+        })
+        assert response.status_code == 200
+        assert response.json == {"message": "Login successful"}
+
+        response = client.get('/api/user_info')
+        assert response.status_code == 200
+        assert response.json == {'username': 'testuser'}
+
+    def test_login_with_wrong_password_is_rejected(self, client, test_user):
+        """Test that a wrong password is refused and no session is started."""
+        response = client.post('/api/login', json={
+            'username': 'testuser',
+            'password': 'wrongpass'
+        })
+        assert response.status_code == 401
+        assert response.json == {"message": "Invalid username or password."}
+
+        assert client.get('/api/user_info').status_code == 401
+
+    def test_login_rehashes_outdated_password_hash(self, app, db, client):
+        """Test that logging in upgrades a hash made with another method to the configured one."""
+        user = User(
+            username='olduser',
+            password_hash=generate_password_hash('oldpass123', method='pbkdf2:sha256:2')
+        )
+        db.session.add(user)
+        db.session.commit()
+        assert user.password_needs_rehash()
+
+        response = client.post('/api/login', json={
+            'username': 'olduser',
+            'password': 'oldpass123'
+        })
+        assert response.status_code == 200
+
+        db.session.refresh(user)
+        assert user.password_hash.split('$', 1)[0] == app.config['PASSWORD_HASH_METHOD']
+        assert not user.password_needs_rehash()
+        assert user.check_password('oldpass123')
@@ -7,68 +7,80 @@ that are valid for the current partition type.
 
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import event, insert
 from models import db, Goal, GoalGroup, GoalEntry
 
+# Daily boundary strings for October 2024, built once for every fixture
+DAILY_BOUNDARIES = tuple((datetime(2024, 10, 1) + timedelta(days=i)).isoformat()[:10] for i in range(31))
+
+# Valid boundaries for groups starting 2024-10-01 with entries through Oct 15
+VALID_WEEKLY = set(DAILY_BOUNDARIES[:15:7])
+VALID_BIWEEKLY = set(DAILY_BOUNDARIES[::14])
+
+
+@pytest.fixture(scope='class')
+def daily_goal_group(class_session, test_squad):
+    """Create a Daily goal group."""
+    group = GoalGroup(
+        squad_id=test_squad.id,
+        group_name="Daily Goals",
+        partition_type="Daily",
+        start_date=datetime(2024, 10, 1),
+        end_date=datetime(2024, 10, 31)
+    )
+    class_session.add(group)
+    class_session.commit()
+    return group
+
+
+@pytest.fixture(scope='class')
+def weekly_goal_group(class_session, test_squad):
+    """Create a Weekly goal group."""
+    group = GoalGroup(
+        squad_id=test_squad.id,
+        group_name="Weekly Goals",
+        partition_type="Weekly",
+        start_date=datetime(2024, 10, 1),
+        end_date=datetime(2024, 10, 31)
+    )
+    class_session.add(group)
+    class_session.commit()
+    return group
+
+
+@pytest.fixture(scope='class')
+def biweekly_goal_group(class_session, test_squad):
+    """Create a BiWeekly goal group."""
+    group = GoalGroup(
+        squad_id=test_squad.id,
+        group_name="BiWeekly Goals",
+        partition_type="BiWeekly",
+        start_date=datetime(2024, 10, 1),
+        end_date=datetime(2024, 10, 31)
+    )
+    class_session.add(group)
+    class_session.commit()
+    return group
+
+
+@pytest.fixture(scope='class')
+def monthly_goal_group(class_session, test_squad):
+    """Create a Monthly goal group."""
+    group = GoalGroup(
+        squad_id=test_squad.id,
+        group_name="Monthly Goals",
+        partition_type="Monthly",
+        start_date=datetime(2024, 10, 1),
+        end_date=datetime(2025, 1, 1)
+    )
+    class_session.add(group)
+    class_session.commit()
+    return group
+
 
 class TestGoalHistoryPartitionFiltering:
     """Tests for goal history filtering by partition type."""
 
-    @pytest.fixture
-    def daily_goal_group(self, db, test_squad):
-        """Create a Daily goal group."""
-        group = GoalGroup(
-            squad_id=test_squad.id,
-            group_name="Daily Goals",
-            partition_type="Daily",
-            start_date=datetime(2024, 10, 1),
-            end_date=datetime(2024, 10, 31)
-        )
-        db.session.add(group)
-        db.session.commit()
-        return group
-
-    @pytest.fixture
-    def weekly_goal_group(self, db, test_squad):
-        """Create a Weekly goal group."""
-        group = GoalGroup(
-            squad_id=test_squad.id,
-            group_name="Weekly Goals",
-            partition_type="Weekly",
-            start_date=datetime(2024, 10, 1),
-            end_date=datetime(2024, 10, 31)
-        )
-        db.session.add(group)
-        db.session.commit()
-        return group
-
-    @pytest.fixture
-    def biweekly_goal_group(self, db, test_squad):
-        """Create a BiWeekly goal group."""
-        group = GoalGroup(
-            squad_id=test_squad.id,
-            group_name="BiWeekly Goals",
-            partition_type="BiWeekly",
-            start_date=datetime(2024, 10, 1),
-            end_date=datetime(2024, 10, 31)
-        )
-        db.session.add(group)
-        db.session.commit()
-        return group
-
-    @pytest.fixture
-    def monthly_goal_group(self, db, test_squad):
-        """Create a Monthly goal group."""
-        group = GoalGroup(
-            squad_id=test_squad.id,
-            group_name="Monthly Goals",
-            partition_type="Monthly",
-            start_date=datetime(2024, 10, 1),
-            end_date=datetime(2025, 1, 1)
-        )
-        db.session.add(group)
-        db.session.commit()
-        return group
-
     @pytest.fixture
     def goal_with_daily_entries(self, db, test_user, test_squad, daily_goal_group):
         """Create a goal with daily entries, simulating a partition change scenario."""
@@ -85,55 +97,56 @@ class TestGoalHistoryPartitionFiltering:
         db.session.commit()
 
         # Add daily entries from Oct 1-15
-        for day_offset in range(15):
-            date = datetime(2024, 10, 1) + timedelta(days=day_offset)
-            entry = GoalEntry(
-                user_id=test_user.id,
-                squad_id=test_squad.id,
-                goal_id=goal.id,
-                boundary_value=date.strftime("%Y-%m-%d"),
-                value=str(30 + day_offset),
-                note=f"Day {day_offset + 1}"
-            )
-            db.session.add(entry)
-
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": boundary_value,
+                "value": str(30 + day_offset),
+                "note": f"Day {day_offset + 1}"
+            }
+            for day_offset, boundary_value in enumerate(DAILY_BOUNDARIES[:15])
+        ])
         db.session.commit()
         return goal
 
-    def test_daily_partition_returns_all_entries(
-        self,
-        authenticated_client,
-        test_squad,
-        goal_with_daily_entries
-    ):
-        """Test that Daily partition returns all daily entries."""
-        response = authenticated_client.get(
-            f'/api/squads/{test_squad.id}/goals/history?page_size=100'
-        )
-
-        assert response.status_code == 200
-        data = response.json
-
-        # Should have one goal group
-        assert len(data['groups']) == 1
-        goal_data = data['groups'][0]
-
-        # All 15 entries should be present
-        assert len(goal_data['boundaries']) >= 15
-
-    def test_weekly_partition_filters_daily_entries(
+    @pytest.fixture
+    def partition_group(self, request, daily_goal_group, weekly_goal_group, biweekly_goal_group):
+        """
+        Goal group for the partition type given as the test parameter.
+
+        The class-scoped groups are requested directly rather than through
+        request.getfixturevalue, so they are created before the test's
+        SAVEPOINT and survive its rollback.
+        """
+        return {
+            'Daily': daily_goal_group,
+            'Weekly': weekly_goal_group,
+            'BiWeekly': biweekly_goal_group
+        }[request.param]
+
+    @pytest.mark.parametrize('partition_group, expected_boundaries', [
+        # Daily keeps every entry from Oct 1-15
+        ('Daily', set(DAILY_BOUNDARIES[:15])),
+        # Weekly keeps Oct 1, 8, 15
+        ('Weekly', VALID_WEEKLY),
+        # BiWeekly keeps Oct 1, 15 and drops weekly-only Oct 8
+        ('BiWeekly', VALID_BIWEEKLY & set(DAILY_BOUNDARIES[:15])),
+    ], indirect=['partition_group'], ids=['daily', 'weekly', 'biweekly'])
+    def test_partition_filters_daily_entries(
         self,
         db,
         authenticated_client,
         test_squad,
-        test_user,
-        weekly_goal_group,
-        goal_with_daily_entries
+        goal_with_daily_entries,
+        partition_group,
+        expected_boundaries
     ):
-        """Test that Weekly partition filters out non-weekly boundaries."""
-        # Change goal to weekly group (simulating partition change)
+        """Test that moving a goal with daily entries into a partition keeps only its boundaries."""
+        # Move goal into the partition's group (simulating partition change)
         goal = goal_with_daily_entries
-        goal.group_id = weekly_goal_group.id
+        goal.group_id = partition_group.id
         db.session.commit()
 
         response = authenticated_client.get(
@@ -147,62 +160,10 @@ class TestGoalHistoryPartitionFiltering:
         assert len(data['groups']) == 1
         goal_data = data['groups'][0]
 
-        # Extract returned boundaries
-        boundaries = list(goal_data['boundaries'].keys())
-
-        # Should only include weekly boundaries: Oct 1, 8, 15
-        # (entries from other days should be filtered out)
-        expected_weekly = {"2024-10-01", "2024-10-08", "2024-10-15"}
-        returned_with_data = {b for b in boundaries if goal_data['boundaries'][b]['value'] is not None}
-
-        # All returned entries with data should be valid weekly boundaries
-        assert returned_with_data == expected_weekly
-
-        # Should NOT include daily boundaries like Oct 2, 3, 4, etc.
-        invalid_boundaries = {"2024-10-02", "2024-10-03", "2024-10-04", "2024-10-05"}
-        for invalid in invalid_boundaries:
-            if invalid in boundaries:
-                # If it's in boundaries, it should be blank (filled gap)
-                assert goal_data['boundaries'][invalid]['value'] is None
-
-    def test_biweekly_partition_filters_weekly_entries(
-        self,
-        db,
-        authenticated_client,
-        test_squad,
-        biweekly_goal_group,
-        goal_with_daily_entries
-    ):
-        """Test that BiWeekly partition filters out non-biweekly boundaries."""
-        # Change goal to biweekly group
-        goal = goal_with_daily_entries
-        goal.group_id = biweekly_goal_group.id
-        db.session.commit()
-
-        response = authenticated_client.get(
-            f'/api/squads/{test_squad.id}/goals/history?page_size=100'
-        )
-
-        assert response.status_code == 200
-        data = response.json
-
-        goal_data = data['groups'][0]
-        boundaries = list(goal_data['boundaries'].keys())
-        returned_with_data = {b for b in boundaries if goal_data['boundaries'][b]['value'] is not None}
-
-        # Should only include biweekly boundaries: Oct 1, 15
-        expected_biweekly = {"2024-10-01"}  # Oct 15 is day 14, also valid
-
-        # All returned entries should be valid biweekly boundaries
-        for boundary in returned_with_data:
-            date = datetime.fromisoformat(boundary)
-            start_date = datetime(2024, 10, 1)
-            delta_days = (date - start_date).days
-            # Must be multiple of 14
-            assert delta_days % 14 == 0, f"{boundary} is not a valid biweekly boundary"
-
-        # Should NOT include weekly-only boundaries like Oct 8
-        assert "2024-10-08" not in returned_with_data
+        # Boundaries outside the partition may be present as filled gaps,
+        # but only valid boundaries carry values
+        returned_with_data = {b for b, cell in goal_data['boundaries'].items() if cell['value'] is not None}
+        assert returned_with_data == expected_boundaries
 
     def test_monthly_partition_filters_entries(
         self,
@@ -235,17 +196,17 @@ class TestGoalHistoryPartitionFiltering:
             "2024-12-01",  # Valid (1st)
         ]
 
-        for date_str in dates:
-            entry = GoalEntry(
-                user_id=test_user.id,
-                squad_id=test_squad.id,
-                goal_id=goal.id,
-                boundary_value=date_str,
-                value="1",
-                note="Done"
-            )
-            db.session.add(entry)
-
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": date_str,
+                "value": "1",
+                "note": "Done"
+            }
+            for date_str in dates
+        ])
         db.session.commit()
 
         response = authenticated_client.get(
@@ -268,6 +229,140 @@ class TestGoalHistoryPartitionFiltering:
         assert "2024-10-15" not in returned_with_data
         assert "2024-11-15" not in returned_with_data
 
+    def test_monthly_partition_starting_on_31st(
+        self,
+        db,
+        authenticated_client,
+        test_squad,
+        test_user
+    ):
+        """Test that a Monthly group starting on the 31st keeps entries on clamped month ends."""
+        group = GoalGroup(
+            squad_id=test_squad.id,
+            group_name="Month End Goals",
+            partition_type="Monthly",
+            start_date=datetime(2024, 1, 31),
+            end_date=datetime(2024, 6, 30)
+        )
+        db.session.add(group)
+        db.session.commit()
+
+        goal = Goal(
+            squad_id=test_squad.id,
+            group_id=group.id,
+            name="Month End Review",
+            type="boolean",
+            target="1",
+            is_private=True
+        )
+        db.session.add(goal)
+        db.session.commit()
+
+        dates = [
+            "2024-01-31",  # Valid (start)
+            "2024-02-29",  # Valid (clamped to end of February)
+            "2024-03-02",  # Invalid (Jan 31 + 1 month overflowing into March)
+            "2024-03-31",  # Valid (back on the 31st)
+            "2024-04-30",  # Valid (clamped to end of April)
+        ]
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": date_str,
+                "value": "1"
+            }
+            for date_str in dates
+        ])
+        db.session.commit()
+
+        response = authenticated_client.get(
+            f'/api/squads/{test_squad.id}/goals/history?page_size=100'
+        )
+
+        assert response.status_code == 200
+        goal_data = response.json['groups'][0]
+        assert list(goal_data['boundaries']) == [
+            "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30", "2024-05-31", "2024-06-30"
+        ]
+        returned_with_data = {b for b, cell in goal_data['boundaries'].items() if cell['value'] is not None}
+        assert returned_with_data == {"2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"}
+
+    @pytest.mark.parametrize('partition_type, expected', [
+        # Daily keeps every date from the start on
+        ('Daily', {"1990-01-01", "1990-01-02", "2000-01-03"}),
+        # Weekly keeps Mondays from the 1990-01-01 start
+        ('Weekly', {"1990-01-01", "2000-01-03"}),
+    ], ids=['daily', 'weekly'])
+    def test_long_running_group(
+        self,
+        db,
+        authenticated_client,
+        test_squad,
+        test_user,
+        partition_type,
+        expected
+    ):
+        """Test that a years-long series is filtered without binding a parameter per boundary."""
+        group = GoalGroup(
+            squad_id=test_squad.id,
+            group_name="Long Running Goals",
+            partition_type=partition_type,
+            start_date=datetime(1990, 1, 1),
+            end_date=datetime(2100, 1, 1)
+        )
+        db.session.add(group)
+        db.session.commit()
+
+        goal = Goal(
+            squad_id=test_squad.id,
+            group_id=group.id,
+            name="Long Goal",
+            type="count",
+            target="1",
+            is_private=True
+        )
+        db.session.add(goal)
+        db.session.commit()
+
+        dates = [
+            "1989-12-25",  # Before the start (a Monday)
+            "1990-01-01",  # Start (a Monday)
+            "1990-01-02",  # Off-cycle for Weekly
+            "2000-01-03",  # A Monday
+        ]
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": date_str,
+                "value": "1"
+            }
+            for date_str in dates
+        ])
+        db.session.commit()
+
+        bound_counts = []
+
+        def count_params(conn, cursor, statement, parameters, context, executemany):
+            bound_counts.append(len(parameters))
+
+        event.listen(db.engine, "before_cursor_execute", count_params)
+        try:
+            response = authenticated_client.get(
+                f'/api/squads/{test_squad.id}/goals/history?page_size=100000'
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count_params)
+
+        assert response.status_code == 200
+        goal_data = response.json['groups'][0]
+        returned_with_data = {b for b, cell in goal_data['boundaries'].items() if cell['value'] is not None}
+        assert returned_with_data == expected
+        assert max(bound_counts) < 100
+
     def test_empty_history_with_no_valid_boundaries(
         self,
         db,
@@ -292,17 +387,17 @@ class TestGoalHistoryPartitionFiltering:
         # Add entries that are NOT weekly boundaries
         # (simulating old daily entries)
         invalid_dates = ["2024-10-02", "2024-10-03", "2024-10-04"]
-        for date_str in invalid_dates:
-            entry = GoalEntry(
-                user_id=test_user.id,
-                squad_id=test_squad.id,
-                goal_id=goal.id,
-                boundary_value=date_str,
-                value="5",
-                note="Invalid"
-            )
-            db.session.add(entry)
-
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": date_str,
+                "value": "5",
+                "note": "Invalid"
+            }
+            for date_str in invalid_dates
+        ])
         db.session.commit()
 
         response = authenticated_client.get(
@@ -349,29 +444,29 @@ class TestGoalHistoryPartitionFiltering:
         db.session.commit()
 
         # Add daily entries for daily goal
-        for day_offset in range(10):
-            date = datetime(2024, 10, 1) + timedelta(days=day_offset)
-            entry = GoalEntry(
-                user_id=test_user.id,
-                squad_id=test_squad.id,
-                goal_id=daily_goal.id,
-                boundary_value=date.strftime("%Y-%m-%d"),
-                value="10000"
-            )
-            db.session.add(entry)
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": daily_goal.id,
+                "boundary_value": boundary_value,
+                "value": "10000"
+            }
+            for boundary_value in DAILY_BOUNDARIES[:10]
+        ])
 
         # Add entries for weekly goal (mix of valid and invalid)
         weekly_dates = ["2024-10-01", "2024-10-02", "2024-10-08", "2024-10-09"]
-        for date_str in weekly_dates:
-            entry = GoalEntry(
-                user_id=test_user.id,
-                squad_id=test_squad.id,
-                goal_id=weekly_goal.id,
-                boundary_value=date_str,
-                value="5"
-            )
-            db.session.add(entry)
-
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": weekly_goal.id,
+                "boundary_value": date_str,
+                "value": "5"
+            }
+            for date_str in weekly_dates
+        ])
         db.session.commit()
 
         response = authenticated_client.get(
@@ -385,8 +480,9 @@ class TestGoalHistoryPartitionFiltering:
         assert len(data['groups']) == 2
 
         # Find each goal in results
-        daily_data = next(g for g in data['groups'] if g['goal_name'] == 'Daily Steps')
-        weekly_data = next(g for g in data['groups'] if g['goal_name'] == 'Weekly Workout')
+        by_name = {g['goal_name']: g for g in data['groups']}
+        daily_data = by_name['Daily Steps']
+        weekly_data = by_name['Weekly Workout']
 
         # Daily goal should have all entries
         daily_with_data = {b for b in daily_data['boundaries'] if daily_data['boundaries'][b]['value'] is not None}
@@ -398,3 +494,91 @@ class TestGoalHistoryPartitionFiltering:
         assert "2024-10-08" in weekly_with_data
         assert "2024-10-02" not in weekly_with_data
         assert "2024-10-09" not in weekly_with_data
+
+    def test_summary_counts_only_valid_boundaries(
+        self,
+        db,
+        authenticated_client,
+        test_squad,
+        weekly_goal_group,
+        goal_with_daily_entries
+    ):
+        """Test that the summary aggregates only entries on valid boundaries."""
+        goal_with_daily_entries.group_id = weekly_goal_group.id
+        db.session.commit()
+
+        response = authenticated_client.get(
+            f'/api/squads/{test_squad.id}/goals/summary'
+        )
+
+        assert response.status_code == 200
+        goals = response.json['goals']
+        assert len(goals) == 1
+
+        # Only the entries on weekly boundaries (Oct 1, 8, 15) are counted
+        summary = goals[0]
+        assert summary['goal_id'] == goal_with_daily_entries.id
+        assert (summary['met'], summary['unmet'], summary['blank']) == (3, 0, 0)
+
+    def test_summary_skips_misaligned_entries_in_open_ended_group(
+        self,
+        db,
+        authenticated_client,
+        test_squad,
+        test_user
+    ):
+        """Test that the summary drops off-cycle entries of a group without an end date, like the history."""
+        group = GoalGroup(
+            squad_id=test_squad.id,
+            group_name="Open Weekly Goals",
+            partition_type="Weekly",
+            start_date=datetime(2024, 10, 1)
+        )
+        db.session.add(group)
+        db.session.commit()
+        # end_date has a client-side default, so clear it after the insert
+        GoalGroup.query.filter_by(id=group.id).update({"end_date": None})
+        db.session.commit()
+
+        goal = Goal(
+            squad_id=test_squad.id,
+            group_id=group.id,
+            name="Open Weekly Goal",
+            type="count",
+            target="5",
+            is_private=True
+        )
+        db.session.add(goal)
+        db.session.commit()
+
+        db.session.execute(insert(GoalEntry), [
+            {
+                "user_id": test_user.id,
+                "squad_id": test_squad.id,
+                "goal_id": goal.id,
+                "boundary_value": date_str,
+                "value": value
+            }
+            for date_str, value in [
+                ("2024-10-01", "5"),  # Valid, met
+                ("2024-10-02", "5"),  # Off-cycle
+                ("2024-10-08", "1"),  # Valid, unmet
+                ("2024-10-09", "1"),  # Off-cycle
+            ]
+        ])
+        db.session.commit()
+
+        response = authenticated_client.get(
+            f'/api/squads/{test_squad.id}/goals/summary/{group.id}'
+        )
+
+        assert response.status_code == 200
+        goals = response.json['goals']
+        assert len(goals) == 1
+        assert (goals[0]['met'], goals[0]['unmet'], goals[0]['blank']) == (1, 1, 0)
+
+        history = authenticated_client.get(
+            f'/api/squads/{test_squad.id}/goals/history/{group.id}?page_size=100'
+        ).json
+        boundaries = history['groups'][0]['boundaries']
+        assert {b for b, cell in boundaries.items() if cell['value'] is not None} == {"2024-10-01", "2024-10-08"}
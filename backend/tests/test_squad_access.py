@@ -6,172 +6,165 @@ SquadsPage.tsx was not rendering for non-admin users.
 """
 
 import pytest
-from models import db, User, Squad, SquadMember
+from models import db, User, Squad, SquadMember, SquadInvite, Goal, GoalGroup, GoalEntry
 
 
-def test_non_admin_can_list_squads(client, db):
-    """Test that non-admin user can list their squads."""
-    # Create admin user
+@pytest.fixture(scope='class')
+def squad_with_members(class_session):
+    """
+    Create a squad with an admin, a non-admin member and an outsider.
+
+    Args:
+        class_session: Class-scoped session fixture
+
+    Returns:
+        Tuple of (admin, member, outsider, squad)
+    """
     admin = User(username='admin')
     admin.set_password('admin123')
-    db.session.add(admin)
-    db.session.commit()
-
-    # Create non-admin user
     member = User(username='member')
     member.set_password('member123')
-    db.session.add(member)
-    db.session.commit()
+    outsider = User(username='outsider')
+    outsider.set_password('outsider123')
+    class_session.add_all([admin, member, outsider])
+    class_session.commit()
 
     # Create squad with admin as owner
     squad = Squad(name='Test Squad', admin_id=admin.id)
-    db.session.add(squad)
-    db.session.commit()
+    class_session.add(squad)
+    class_session.commit()
 
-    # Add both users as members
-    admin_membership = SquadMember(squad_id=squad.id, user_id=admin.id)
-    member_membership = SquadMember(squad_id=squad.id, user_id=member.id)
-    db.session.add(admin_membership)
-    db.session.add(member_membership)
-    db.session.commit()
+    # Add admin and member, but not the outsider
+    class_session.add_all([
+        SquadMember(squad_id=squad.id, user_id=admin.id),
+        SquadMember(squad_id=squad.id, user_id=member.id)
+    ])
+    class_session.commit()
 
-    # Login as non-admin member
-    response = client.post('/api/login', json={
-        'username': 'member',
-        'password': 'member123'
-    })
-    assert response.status_code == 200
+    return admin, member, outsider, squad
 
-    # Get squads - should succeed for non-admin member
-    response = client.get('/api/squads')
-    assert response.status_code == 200
 
-    data = response.get_json()
-    assert isinstance(data, list)
-    assert len(data) == 1
-    assert data[0]['name'] == 'Test Squad'
-    assert data[0]['admin'] == 'admin'
-    assert data[0]['is_admin'] == False  # Member is not admin
-    assert data[0]['members'] == 2
+class TestSquadMemberAccess:
+    """Tests for squad access by members who are not the admin, and by outsiders."""
 
+    def test_non_admin_can_list_squads(self, login_as, db, squad_with_members):
+        """Test that non-admin user can list their squads."""
+        admin, member, outsider, squad = squad_with_members
 
-def test_non_admin_can_view_squad_details(client, db):
-    """Test that non-admin user can view squad details."""
-    # Create admin user
-    admin = User(username='admin')
-    admin.set_password('admin123')
-    db.session.add(admin)
-    db.session.commit()
-
-    # Create non-admin user
-    member = User(username='member')
-    member.set_password('member123')
-    db.session.add(member)
-    db.session.commit()
-
-    # Create squad
-    squad = Squad(name='Test Squad', admin_id=admin.id)
-    db.session.add(squad)
-    db.session.commit()
+        # Login as non-admin member
+        client = login_as(member)
 
-    # Add both as members
-    admin_membership = SquadMember(squad_id=squad.id, user_id=admin.id)
-    member_membership = SquadMember(squad_id=squad.id, user_id=member.id)
-    db.session.add(admin_membership)
-    db.session.add(member_membership)
-    db.session.commit()
+        # Get squads - should succeed for non-admin member
+        response = client.get('/api/squads')
+        assert response.status_code == 200
 
-    # Login as non-admin member
-    client.post('/api/login', json={
-        'username': 'member',
-        'password': 'member123'
-    })
+        data = response.get_json()
+        assert isinstance(data, list)
+        assert len(data) == 1
+        assert data[0]['name'] == 'Test Squad'
+        assert data[0]['admin'] == 'admin'
+        assert data[0]['is_admin'] == False  # Member is not admin
+        assert data[0]['members'] == 2
 
-    # Get squad details - should succeed for member
-    response = client.get(f'/api/squads/{squad.id}')
-    assert response.status_code == 200
+    def test_non_admin_can_view_squad_details(self, login_as, db, squad_with_members):
+        """Test that non-admin user can view squad details."""
+        admin, member, outsider, squad = squad_with_members
 
-    data = response.get_json()
-    assert data['name'] == 'Test Squad'
-    assert data['admin'] == 'admin'
-    assert data['is_admin'] == False
-    assert len(data['members']) == 2
+        # Login as non-admin member
+        client = login_as(member)
 
+        # Get squad details - should succeed for member
+        response = client.get(f'/api/squads/{squad.id}')
+        assert response.status_code == 200
 
-def test_non_admin_cannot_delete_squad(client, db):
-    """Test that non-admin user cannot delete squad."""
-    # Create admin user
-    admin = User(username='admin')
-    admin.set_password('admin123')
-    db.session.add(admin)
-    db.session.commit()
+        data = response.get_json()
+        assert data['name'] == 'Test Squad'
+        assert data['admin'] == 'admin'
+        assert data['is_admin'] == False
+        assert len(data['members']) == 2
 
-    # Create non-admin user
-    member = User(username='member')
-    member.set_password('member123')
-    db.session.add(member)
-    db.session.commit()
+    def test_non_admin_cannot_delete_squad(self, login_as, db, squad_with_members):
+        """Test that non-admin user cannot delete squad."""
+        admin, member, outsider, squad = squad_with_members
 
-    # Create squad
-    squad = Squad(name='Test Squad', admin_id=admin.id)
-    db.session.add(squad)
-    db.session.commit()
+        # Login as non-admin member
+        client = login_as(member)
 
-    # Add both as members
-    admin_membership = SquadMember(squad_id=squad.id, user_id=admin.id)
-    member_membership = SquadMember(squad_id=squad.id, user_id=member.id)
-    db.session.add(admin_membership)
-    db.session.add(member_membership)
-    db.session.commit()
+        # Try to delete squad - should fail with 403
+        response = client.delete(f'/api/squads/{squad.id}')
+        assert response.status_code == 403
 
-    # Login as non-admin member
-    client.post('/api/login', json={
-        'username': 'member',
-        'password': 'member123'
-    })
+        data = response.get_json()
+        assert 'error' in data
+        assert 'Not authorized' in data['error']
 
-    # Try to delete squad - should fail with 403
-    response = client.delete(f'/api/squads/{squad.id}')
-    assert response.status_code == 403
+    def test_non_member_cannot_view_squad(self, login_as, db, squad_with_members):
+        """Test that non-member cannot view squad details."""
+        admin, member, outsider, squad = squad_with_members
 
-    data = response.get_json()
-    assert 'error' in data
-    assert 'Not authorized' in data['error']
+        # Login as non-member
+        client = login_as(outsider)
 
+        # Try to view squad - should fail with 403
+        response = client.get(f'/api/squads/{squad.id}')
+        assert response.status_code == 403
 
-def test_non_member_cannot_view_squad(client, db):
-    """Test that non-member cannot view squad details."""
-    # Create admin user
-    admin = User(username='admin')
-    admin.set_password('admin123')
-    db.session.add(admin)
-    db.session.commit()
+        data = response.get_json()
+        assert 'message' in data
+        assert 'Not a squad member' in data['message']
 
-    # Create non-member user
-    outsider = User(username='outsider')
-    outsider.set_password('outsider123')
-    db.session.add(outsider)
-    db.session.commit()
 
-    # Create squad with only admin as member
-    squad = Squad(name='Test Squad', admin_id=admin.id)
-    db.session.add(squad)
+def test_admin_can_bulk_remove_members(authenticated_client, db, test_squad):
+    """Test that bulk removal drops memberships and pending invites together."""
+    users = [User(username=f'member{i}') for i in range(3)]
+    for user in users:
+        user.set_password('member123')
+    db.session.add_all(users)
     db.session.commit()
 
-    admin_membership = SquadMember(squad_id=squad.id, user_id=admin.id)
-    db.session.add(admin_membership)
+    for user in users:
+        db.session.add(SquadMember(squad_id=test_squad.id, user_id=user.id))
+    db.session.add(SquadInvite(squad_id=test_squad.id, invited_user_id=users[0].id))
     db.session.commit()
 
-    # Login as non-member
-    client.post('/api/login', json={
-        'username': 'outsider',
-        'password': 'outsider123'
-    })
-
-    # Try to view squad - should fail with 403
-    response = client.get(f'/api/squads/{squad.id}')
-    assert response.status_code == 403
+    response = authenticated_client.post(
+        f'/api/squads/{test_squad.id}/members/bulk_delete',
+        json={'usernames': ['member0', 'member1', 'nobody']}
+    )
+    assert response.status_code == 200
+    assert response.get_json()['removed'] == ['member0', 'member1']
+
+    remaining = {m.user_id for m in SquadMember.query.filter_by(squad_id=test_squad.id)}
+    assert remaining == {test_squad.admin_id, users[2].id}
+    assert SquadInvite.query.filter_by(squad_id=test_squad.id).count() == 0
+
+    # The administrator can never be removed
+    response = authenticated_client.post(
+        f'/api/squads/{test_squad.id}/members/bulk_delete',
+        json={'usernames': ['testuser']}
+    )
+    assert response.status_code == 400
+
+
+def test_admin_delete_squad_removes_dependent_rows(authenticated_client, db, test_user, test_squad):
+    """Test that deleting a squad removes its goals, groups, entries, members and invites."""
+    group = GoalGroup(squad_id=test_squad.id, group_name='Daily', partition_type='Daily')
+    db.session.add(group)
+    db.session.flush()
+    goal = Goal(squad_id=test_squad.id, group_id=group.id, name='Run', type='count')
+    db.session.add(goal)
+    db.session.flush()
+    db.session.add(GoalEntry(
+        user_id=test_user.id, squad_id=test_squad.id, goal_id=goal.id,
+        boundary_value='2024-01-01', value='1'
+    ))
+    db.session.add(SquadInvite(squad_id=test_squad.id, invited_user_id=test_user.id))
+    db.session.commit()
+    squad_id = test_squad.id
+
+    response = authenticated_client.delete(f'/api/squads/{squad_id}')
+    assert response.status_code == 200
 
-    data = response.get_json()
-    assert 'message' in data
-    assert 'Not a squad member' in data['message']
+    assert db.session.get(Squad, squad_id) is None
+    for model in (GoalEntry, Goal, GoalGroup, SquadMember, SquadInvite):
+        assert model.query.filter_by(squad_id=squad_id).count() == 0
@@ -8,7 +8,7 @@ Tests cover:
 """
 
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from utils import (
     parse_date_range,
     parse_iso_datetime_range,
@@ -17,8 +17,15 @@ from utils import (
     validate_partition_data,
     validate_counter_partition,
     validate_time_partition,
-    is_boundary_valid_for_partition
+    is_boundary_valid_for_partition,
+    upsert_goal_entries,
+    get_goal_entries_bulk,
+    check_goal_status,
+    _parse_iso
 )
+import utils
+from models import Goal, GoalEntry, GoalGroup
+from routes.goal_entries import generate_boundary_series
 
 
 class TestParseDateRange:
@@ -27,38 +34,39 @@ class TestParseDateRange:
     def test_parse_with_start_and_end(self):
         """Test parsing with both start and end dates."""
         start, end, error = parse_date_range("2024-01-01", "2024-01-31")
-        assert start == date(2024, 1, 1)
-        assert end == date(2024, 1, 31)
-        assert error is None
+        assert (start, end, error) == (date(2024, 1, 1), date(2024, 1, 31), None)
 
     def test_parse_single_date(self):
         """Test parsing with single date."""
         start, end, error = parse_date_range(single_date="2024-01-15")
-        assert start == date(2024, 1, 15)
-        assert end == date(2024, 1, 15)
-        assert error is None
+        assert (start, end, error) == (date(2024, 1, 15), date(2024, 1, 15), None)
 
     def test_parse_default_to_today(self):
         """Test default to today when no dates provided."""
         start, end, error = parse_date_range()
         today = datetime.utcnow().date()
-        assert start == today
-        assert end == today
-        assert error is None
+        assert (start, end, error) == (today, today, None)
+
+    def test_parse_default_to_utc_today(self, monkeypatch):
+        """Test that today is the UTC date, frozen here to a late UTC hour."""
+        class FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return datetime(2024, 2, 29, 23, 30)
+
+        monkeypatch.setattr(utils, "datetime", FrozenDatetime)
+        start, end, error = parse_date_range()
+        assert (start, end, error) == (date(2024, 2, 29), date(2024, 2, 29), None)
 
     def test_parse_invalid_format(self):
         """Test error on invalid date format."""
         start, end, error = parse_date_range("01/01/2024", "01/31/2024")
-        assert start is None
-        assert end is None
-        assert error == "Invalid date format. Must be YYYY-MM-DD"
+        assert (start, end, error) == (None, None, "Invalid date format. Must be YYYY-MM-DD")
 
     def test_parse_no_default(self):
         """Test behavior when default_to_today is False."""
         start, end, error = parse_date_range(default_to_today=False)
-        assert start is None
-        assert end is None
-        assert error == "No date provided"
+        assert (start, end, error) == (None, None, "No date provided")
 
 
 class TestParseIsoDatetimeRange:
@@ -70,9 +78,7 @@ class TestParseIsoDatetimeRange:
             "2024-01-01T00:00:00",
             "2024-01-31T23:59:59"
         )
-        assert start == datetime(2024, 1, 1, 0, 0, 0)
-        assert end == datetime(2024, 1, 31, 23, 59, 59)
-        assert error is None
+        assert (start, end, error) == (datetime(2024, 1, 1, 0, 0, 0), datetime(2024, 1, 31, 23, 59, 59), None)
 
     def test_parse_with_utc_suffix(self):
         """Test parsing ISO datetimes with Z suffix."""
@@ -83,6 +89,7 @@ class TestParseIsoDatetimeRange:
         assert start is not None
         assert end is not None
         assert error is None
+        assert start.utcoffset() == timedelta(0)
 
     def test_parse_start_after_end(self):
         """Test error when start is after end."""
@@ -90,9 +97,7 @@ class TestParseIsoDatetimeRange:
             "2024-01-31T00:00:00",
             "2024-01-01T00:00:00"
         )
-        assert start is None
-        assert end is None
-        assert error == "Start date/time must be before end date/time"
+        assert (start, end, error) == (None, None, "Start date/time must be before end date/time")
 
     def test_parse_invalid_format(self):
         """Test error on invalid datetime format."""
@@ -104,6 +109,20 @@ class TestParseIsoDatetimeRange:
         assert end is None
         assert "Invalid date/datetime format" in error
 
+    def test_parse_non_string_input(self):
+        """Test error, not an exception, for unhashable JSON values."""
+        start, end, error = parse_iso_datetime_range(["2024-01-01"], "2024-01-31")
+        assert start is None
+        assert end is None
+        assert "Invalid date/datetime format" in error
+
+    def test_parse_reuses_cached_results(self):
+        """Test that repeated strings are served from the parse cache."""
+        parse_iso_datetime_range("2024-03-01T00:00:00Z", "2024-03-31T23:59:59Z")
+        hits = _parse_iso.cache_info().hits
+        parse_iso_datetime_range("2024-03-01T00:00:00Z", "2024-03-31T23:59:59Z")
+        assert _parse_iso.cache_info().hits == hits + 2
+
 
 class TestValidateCounterRange:
     """Tests for validate_counter_range function."""
@@ -111,44 +130,37 @@ class TestValidateCounterRange:
     def test_validate_valid_range(self):
         """Test validation of valid counter range."""
         start, end, error = validate_counter_range(1, 10)
-        assert start == 1
-        assert end == 10
-        assert error is None
+        assert (start, end, error) == (1, 10, None)
 
     def test_validate_with_none_start(self):
         """Test validation with None start value."""
         start, end, error = validate_counter_range(None, 10)
-        assert start == 0  # Default
-        assert end == 10
-        assert error is None
+        assert (start, end, error) == (0, 10, None)  # Default start
 
     def test_validate_with_none_end(self):
         """Test validation with None end value."""
         start, end, error = validate_counter_range(5, None)
-        assert start == 5
-        assert end is None
-        assert error is None
+        assert (start, end, error) == (5, None, None)
+
+    def test_validate_with_blank_end(self):
+        """Test that a blank end string means no end value."""
+        start, end, error = validate_counter_range(5, "  ")
+        assert (start, end, error) == (5, None, None)
 
     def test_validate_string_numbers(self):
         """Test validation with string representations of numbers."""
         start, end, error = validate_counter_range("5", "15")
-        assert start == 5
-        assert end == 15
-        assert error is None
+        assert (start, end, error) == (5, 15, None)
 
     def test_validate_start_equals_end(self):
         """Test error when start equals or exceeds end."""
         start, end, error = validate_counter_range(10, 10)
-        assert start is None
-        assert end is None
-        assert error == "Start value must be less than or equal to end value"
+        assert (start, end, error) == (None, None, "Start value must be less than or equal to end value")
 
     def test_validate_invalid_values(self):
         """Test error with non-numeric values."""
         start, end, error = validate_counter_range("not-a-number", 10)
-        assert start is None
-        assert end is None
-        assert error == "CustomCounter start/end values must be integers"
+        assert (start, end, error) == (None, None, "CustomCounter start/end values must be integers")
 
 
 class TestValidateBoundaryValue:
@@ -189,6 +201,18 @@ class TestValidatePartitionData:
         assert data is None
         assert "Invalid partition_type" in error
 
+    def test_validate_default_partition_types(self):
+        """Test the default VALID_PARTITION_TYPES, including non-string input."""
+        data_input = {
+            'start_date': '2024-01-01T00:00:00Z',
+            'end_date': '2024-01-02T00:00:00Z'
+        }
+        data, error = validate_partition_data('Hourly', data_input)
+        assert error is None
+        data, error = validate_partition_data(['Daily'], data_input)
+        assert data is None
+        assert "Invalid partition_type" in error
+
     def test_validate_custom_counter_partition(self):
         """Test validation of CustomCounter partition."""
         data_input = {
@@ -233,123 +257,182 @@ class TestValidatePartitionData:
         assert error == "Missing required group fields (start_date, end_date)"
 
 
-class TestIsBoundaryValidForPartition:
-    """Tests for is_boundary_valid_for_partition function."""
-
-    def test_daily_partition_all_valid(self):
-        """Test that all dates are valid for Daily partition."""
-        start = "2024-10-01"
-        assert is_boundary_valid_for_partition("2024-10-01", "Daily", start) is True
-        assert is_boundary_valid_for_partition("2024-10-02", "Daily", start) is True
-        assert is_boundary_valid_for_partition("2024-10-03", "Daily", start) is True
-        assert is_boundary_valid_for_partition("2024-10-15", "Daily", start) is True
-
-    def test_weekly_partition_valid_boundaries(self):
-        """Test Weekly partition only accepts 7-day intervals."""
-        start = "2024-10-01"
-        # Valid: start date and multiples of 7 days
-        assert is_boundary_valid_for_partition("2024-10-01", "Weekly", start) is True  # Day 0
-        assert is_boundary_valid_for_partition("2024-10-08", "Weekly", start) is True  # Day 7
-        assert is_boundary_valid_for_partition("2024-10-15", "Weekly", start) is True  # Day 14
-        assert is_boundary_valid_for_partition("2024-10-22", "Weekly", start) is True  # Day 21
-        assert is_boundary_valid_for_partition("2024-10-29", "Weekly", start) is True  # Day 28
-
-    def test_weekly_partition_invalid_boundaries(self):
-        """Test Weekly partition rejects non-7-day intervals."""
-        start = "2024-10-01"
-        # Invalid: not multiples of 7 days
-        assert is_boundary_valid_for_partition("2024-10-02", "Weekly", start) is False  # Day 1
-        assert is_boundary_valid_for_partition("2024-10-03", "Weekly", start) is False  # Day 2
-        assert is_boundary_valid_for_partition("2024-10-07", "Weekly", start) is False  # Day 6
-        assert is_boundary_valid_for_partition("2024-10-09", "Weekly", start) is False  # Day 8
-        assert is_boundary_valid_for_partition("2024-10-14", "Weekly", start) is False  # Day 13
-
-    def test_biweekly_partition_valid_boundaries(self):
-        """Test BiWeekly partition only accepts 14-day intervals."""
-        start = "2024-10-01"
-        # Valid: start date and multiples of 14 days
-        assert is_boundary_valid_for_partition("2024-10-01", "BiWeekly", start) is True   # Day 0
-        assert is_boundary_valid_for_partition("2024-10-15", "BiWeekly", start) is True   # Day 14
-        assert is_boundary_valid_for_partition("2024-10-29", "BiWeekly", start) is True   # Day 28
-        assert is_boundary_valid_for_partition("2024-11-12", "BiWeekly", start) is True   # Day 42
-
-    def test_biweekly_partition_invalid_boundaries(self):
-        """Test BiWeekly partition rejects non-14-day intervals."""
-        start = "2024-10-01"
-        # Invalid: not multiples of 14 days
-        assert is_boundary_valid_for_partition("2024-10-08", "BiWeekly", start) is False  # Day 7
-        assert is_boundary_valid_for_partition("2024-10-22", "BiWeekly", start) is False  # Day 21
-        assert is_boundary_valid_for_partition("2024-10-09", "BiWeekly", start) is False  # Day 8
-
-    def test_monthly_partition_valid_boundaries(self):
-        """Test Monthly partition only accepts same day-of-month."""
-        start = "2024-10-01"
-        # Valid: same day of month (1st)
-        assert is_boundary_valid_for_partition("2024-10-01", "Monthly", start) is True
-        assert is_boundary_valid_for_partition("2024-11-01", "Monthly", start) is True
-        assert is_boundary_valid_for_partition("2024-12-01", "Monthly", start) is True
-        assert is_boundary_valid_for_partition("2025-01-01", "Monthly", start) is True
-
-    def test_monthly_partition_invalid_boundaries(self):
-        """Test Monthly partition rejects different day-of-month."""
-        start = "2024-10-01"
-        # Invalid: different day of month
-        assert is_boundary_valid_for_partition("2024-10-02", "Monthly", start) is False
-        assert is_boundary_valid_for_partition("2024-10-15", "Monthly", start) is False
-        assert is_boundary_valid_for_partition("2024-11-15", "Monthly", start) is False
-
-    def test_monthly_partition_mid_month_start(self):
-        """Test Monthly partition with mid-month start date."""
-        start = "2024-10-15"
-        # Valid: 15th of each month
-        assert is_boundary_valid_for_partition("2024-10-15", "Monthly", start) is True
-        assert is_boundary_valid_for_partition("2024-11-15", "Monthly", start) is True
-        assert is_boundary_valid_for_partition("2024-12-15", "Monthly", start) is True
-        # Invalid: different days
-        assert is_boundary_valid_for_partition("2024-10-01", "Monthly", start) is False
-        assert is_boundary_valid_for_partition("2024-11-01", "Monthly", start) is False
-
-    def test_custom_counter_all_valid(self):
-        """Test that all boundaries are valid for CustomCounter partition."""
-        # CustomCounter accepts any boundary
-        assert is_boundary_valid_for_partition("1", "CustomCounter", 1) is True
-        assert is_boundary_valid_for_partition("5", "CustomCounter", 1) is True
-        assert is_boundary_valid_for_partition("100", "CustomCounter", 1) is True
-
-    def test_with_datetime_object(self):
-        """Test validation with datetime object as start_value."""
-        start_dt = datetime(2024, 10, 1)
-        assert is_boundary_valid_for_partition("2024-10-01", "Weekly", start_dt) is True
-        assert is_boundary_valid_for_partition("2024-10-08", "Weekly", start_dt) is True
-        assert is_boundary_valid_for_partition("2024-10-02", "Weekly", start_dt) is False
-
-    def test_unknown_partition_type(self):
-        """Test that unknown partition types accept all boundaries."""
-        start = "2024-10-01"
-        # Should gracefully accept all boundaries for unknown types
-        assert is_boundary_valid_for_partition("2024-10-01", "UnknownType", start) is True
-        assert is_boundary_valid_for_partition("2024-10-15", "UnknownType", start) is True
-
-    def test_invalid_boundary_format(self):
-        """Test graceful handling of invalid boundary format."""
-        start = "2024-10-01"
-        # Should accept invalid format gracefully (returns True on parse error)
-        assert is_boundary_valid_for_partition("not-a-date", "Weekly", start) is True
-
-    def test_weekly_partition_with_different_start_dates(self):
-        """Test Weekly partition alignment with various start dates."""
-        # Start on Tuesday (Oct 1, 2024)
-        start1 = "2024-10-01"
-        assert is_boundary_valid_for_partition("2024-10-01", "Weekly", start1) is True
-        assert is_boundary_valid_for_partition("2024-10-08", "Weekly", start1) is True
-
-        # Start on Sunday (Oct 6, 2024)
-        start2 = "2024-10-06"
-        assert is_boundary_valid_for_partition("2024-10-06", "Weekly", start2) is True
-        assert is_boundary_valid_for_partition("2024-10-13", "Weekly", start2) is True
-        # Oct 8 is not valid for this start date (2 days after start)
-        assert is_boundary_valid_for_partition("2024-10-08", "Weekly", start2) is False
+# Shared group start values for the boundary cases
+OCT_1 = "2024-10-01"
+OCT_1_DT = datetime(2024, 10, 1)
+OCT_6 = "2024-10-06"
+OCT_15 = "2024-10-15"
+
+# (boundary, partition_type, start_value, expected) cases for
+# is_boundary_valid_for_partition
+BOUNDARY_CASES = [
+    # Daily: every date is valid
+    ("2024-10-01", "Daily", OCT_1, True),
+    ("2024-10-02", "Daily", OCT_1, True),
+    ("2024-10-03", "Daily", OCT_1, True),
+    ("2024-10-15", "Daily", OCT_1, True),
+    # Weekly: start date and multiples of 7 days
+    ("2024-10-01", "Weekly", OCT_1, True),   # Day 0
+    ("2024-10-08", "Weekly", OCT_1, True),   # Day 7
+    ("2024-10-15", "Weekly", OCT_1, True),   # Day 14
+    ("2024-10-22", "Weekly", OCT_1, True),   # Day 21
+    ("2024-10-29", "Weekly", OCT_1, True),   # Day 28
+    ("2024-10-02", "Weekly", OCT_1, False),  # Day 1
+    ("2024-10-03", "Weekly", OCT_1, False),  # Day 2
+    ("2024-10-07", "Weekly", OCT_1, False),  # Day 6
+    ("2024-10-09", "Weekly", OCT_1, False),  # Day 8
+    ("2024-10-14", "Weekly", OCT_1, False),  # Day 13
+    # Weekly alignment follows the start date (Oct 6, 2024 is a Sunday)
+    ("2024-10-06", "Weekly", OCT_6, True),
+    ("2024-10-13", "Weekly", OCT_6, True),
+    ("2024-10-08", "Weekly", OCT_6, False),  # 2 days after start
+    # BiWeekly: start date and multiples of 14 days
+    ("2024-10-01", "BiWeekly", OCT_1, True),   # Day 0
+    ("2024-10-15", "BiWeekly", OCT_1, True),   # Day 14
+    ("2024-10-29", "BiWeekly", OCT_1, True),   # Day 28
+    ("2024-11-12", "BiWeekly", OCT_1, True),   # Day 42
+    ("2024-10-08", "BiWeekly", OCT_1, False),  # Day 7
+    ("2024-10-22", "BiWeekly", OCT_1, False),  # Day 21
+    ("2024-10-09", "BiWeekly", OCT_1, False),  # Day 8
+    # Monthly: same day of month as the start date
+    ("2024-10-01", "Monthly", OCT_1, True),
+    ("2024-11-01", "Monthly", OCT_1, True),
+    ("2024-12-01", "Monthly", OCT_1, True),
+    ("2025-01-01", "Monthly", OCT_1, True),
+    ("2024-10-02", "Monthly", OCT_1, False),
+    ("2024-10-15", "Monthly", OCT_1, False),
+    ("2024-11-15", "Monthly", OCT_1, False),
+    ("2024-10-15", "Monthly", OCT_15, True),
+    ("2024-11-15", "Monthly", OCT_15, True),
+    ("2024-12-15", "Monthly", OCT_15, True),
+    ("2024-10-01", "Monthly", OCT_15, False),
+    ("2024-11-01", "Monthly", OCT_15, False),
+    # Monthly: months too short for the start day use their last day
+    ("2024-02-29", "Monthly", "2024-01-31", True),
+    ("2024-03-31", "Monthly", "2024-01-31", True),
+    ("2024-04-30", "Monthly", "2024-01-31", True),
+    ("2024-03-02", "Monthly", "2024-01-31", False),
+    ("2024-03-29", "Monthly", "2024-01-31", False),
+    ("2025-02-28", "Monthly", "2024-02-29", True),
+    # CustomCounter accepts any boundary
+    ("1", "CustomCounter", 1, True),
+    ("5", "CustomCounter", 1, True),
+    ("100", "CustomCounter", 1, True),
+    # start_value may be a datetime
+    ("2024-10-01", "Weekly", OCT_1_DT, True),
+    ("2024-10-08", "Weekly", OCT_1_DT, True),
+    ("2024-10-02", "Weekly", OCT_1_DT, False),
+    # Unknown partition types accept all boundaries
+    ("2024-10-01", "UnknownType", OCT_1, True),
+    ("2024-10-15", "UnknownType", OCT_1, True),
+    # Unparseable boundaries are accepted gracefully
+    ("not-a-date", "Weekly", OCT_1, True),
+]
+
+
+@pytest.mark.parametrize("boundary, partition_type, start_value, expected", BOUNDARY_CASES)
+def test_is_boundary_valid_for_partition(boundary, partition_type, start_value, expected):
+    """Test is_boundary_valid_for_partition against the BOUNDARY_CASES table."""
+    assert is_boundary_valid_for_partition(boundary, partition_type, start_value) is expected
+
+
+@pytest.mark.parametrize("start_day, expected", [
+    (29, ("2024-01-29", "2024-02-29", "2024-03-29", "2024-04-29")),
+    (30, ("2024-01-30", "2024-02-29", "2024-03-30", "2024-04-30")),
+    (31, ("2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30")),
+])
+def test_monthly_series_matches_boundary_check(start_day, expected):
+    """Test that the Monthly series and the Monthly boundary check use the same clamped days."""
+    start, end = datetime(2024, 1, start_day), datetime(2024, 4, 30)
+    assert generate_boundary_series(start, end, "Monthly") == expected
+
+    # Every date in the span is valid exactly when the series contains it
+    days = [(start + timedelta(days=i)).date().isoformat() for i in range((end - start).days + 1)]
+    valid = tuple(d for d in days if is_boundary_valid_for_partition(d, "Monthly", start.date().isoformat()))
+    assert valid == expected
+
+
+@pytest.mark.parametrize("goal_type, target, target_max, entry_value, expected", [
+    ("count", "5", None, None, "blank"),
+    ("count", "5", None, "", "blank"),
+    ("count", "5", None, " \t", "blank"),
+    ("count", "5", None, "5", "met"),
+    ("count", "5", None, "4.5", "unmet"),
+    ("below", "5", None, "3", "met"),
+    ("range", "2", "4", "3", "met"),
+    ("range", "2", "4", "5", "unmet"),
+    ("count", "5", None, "abc", "unmet"),
+    ("boolean", None, None, "true", "met"),
+    ("boolean", None, None, "YES", "met"),
+    ("boolean", None, None, "no", "unmet"),
+    ("time", None, None, "00:30", "met"),
+])
+def test_check_goal_status(goal_type, target, target_max, entry_value, expected):
+    """Test check_goal_status across goal types, including blank values."""
+    assert check_goal_status(goal_type, target, target_max, entry_value) == expected
 
 
 # Note: Database query helper tests require database fixtures
 # and are covered in integration tests
+
+
+class TestUpsertGoalEntries:
+    """Tests for upsert_goal_entries function."""
+
+    @pytest.fixture(params=["native", "fallback"])
+    def upsert_dialect(self, request, monkeypatch):
+        """Run with native ON CONFLICT upsert, and with the per-entry fallback."""
+        if request.param == "fallback":
+            monkeypatch.setattr(utils, "UPSERT_INSERTS", {})
+        return request.param
+
+    @pytest.fixture
+    def goals(self, db, test_squad):
+        """Create two goals in a Daily group."""
+        group = GoalGroup(squad_id=test_squad.id, group_name="Daily", partition_type="Daily")
+        db.session.add(group)
+        db.session.flush()
+        goals = [
+            Goal(squad_id=test_squad.id, group_id=group.id, name=f"Goal {i}", type="count")
+            for i in range(2)
+        ]
+        db.session.add_all(goals)
+        db.session.commit()
+        return goals
+
+    def test_inserts_then_updates_in_place(self, db, test_user, test_squad, goals, upsert_dialect):
+        """Test that a second upsert updates existing rows instead of duplicating them."""
+        upsert_goal_entries(test_user.id, test_squad.id, "2024-01-01", [
+            (goals[0].id, "1", "first"),
+            (goals[1].id, "2", None),
+        ])
+        db.session.commit()
+
+        upsert_goal_entries(test_user.id, test_squad.id, "2024-01-01", [
+            (goals[0].id, "5", "updated"),
+        ])
+        db.session.commit()
+
+        entries = {e.goal_id: e for e in GoalEntry.query.all()}
+        assert len(entries) == 2
+        assert (entries[goals[0].id].value, entries[goals[0].id].note) == ("5", "updated")
+        assert (entries[goals[1].id].value, entries[goals[1].id].note) == ("2", None)
+
+    def test_bulk_fetch_keys_by_user_and_goal(self, db, test_user, test_squad, goals):
+        """Test that get_goal_entries_bulk indexes one boundary's entries by (user_id, goal_id)."""
+        upsert_goal_entries(test_user.id, test_squad.id, "2024-01-01", [(goals[0].id, "1", None)])
+        upsert_goal_entries(test_user.id, test_squad.id, "2024-01-02", [(goals[1].id, "2", None)])
+        db.session.commit()
+
+        existing = get_goal_entries_bulk(
+            [test_user.id], test_squad.id, "2024-01-01", [goal.id for goal in goals]
+        )
+        assert list(existing) == [(test_user.id, goals[0].id)]
+        assert existing[(test_user.id, goals[0].id)].value == "1"
+
+    def test_empty_entries_is_noop(self, db, test_user, test_squad):
+        """Test that an empty submission writes nothing."""
+        upsert_goal_entries(test_user.id, test_squad.id, "2024-01-01", [])
+        db.session.commit()
+
+        assert GoalEntry.query.count() == 0
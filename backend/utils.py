@@ -7,18 +7,81 @@ This module contains helper functions for:
 - Database queries (users, goal entries)
 """
 
+import calendar
+import sys
 from datetime import datetime, date
-from typing import Optional, Tuple, Dict, Any, List, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, List, Union, FrozenSet, Iterable
 from flask import jsonify, Response
-from models import User, GoalEntry
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import load_only, selectinload
+from extensions import cache
+from models import db, generate_uuid, User, Goal, GoalEntry, GoalGroup
 
 # Type aliases for clarity
 ErrorMessage = Optional[str]
 JsonResponse = Tuple[Response, int]
 PartitionData = Dict[str, Optional[Union[str, int, datetime]]]
 
+# Partition types accepted for goal groups
+VALID_PARTITION_TYPES = frozenset((
+    'Minute', 'Hourly', 'Daily', 'Weekly', 'BiWeekly', 'Monthly', 'CustomCounter'
+))
+
+# datetime.fromisoformat accepts a trailing Z (UTC) from Python 3.11 on
+ISO_PARSER_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Dialects supporting INSERT ... ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
 # --- DATE & TIME HELPERS ---
 
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> date:
+    """
+    Parse a YYYY-MM-DD string, caching the result per input string.
+
+    Checks the fixed-width shape, then hands the string to the C
+    date.fromisoformat instead of going through strptime's format parser.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If date_str is not in YYYY-MM-DD format
+    """
+    # fromisoformat also accepts compact and week dates; only take YYYY-MM-DD
+    if not (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'):
+        raise ValueError(f"Invalid date format: {date_str!r}")
+    return date.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(datetime_str: str) -> datetime:
+    """
+    Parse an ISO 8601 string (a trailing Z means UTC), caching the result per input string.
+
+    Args:
+        datetime_str: Date or datetime string in ISO 8601 format
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If datetime_str is not valid ISO 8601
+    """
+    if not ISO_PARSER_ACCEPTS_Z and datetime_str[-1:] == 'Z':
+        datetime_str = datetime_str[:-1] + '+00:00'
+    return datetime.fromisoformat(datetime_str)
+
+
 def parse_date_range(
     start_str: Optional[str] = None,
     end_str: Optional[str] = None,
@@ -39,13 +102,9 @@ def parse_date_range(
     """
     try:
         if start_str and end_str:
-            return (
-                datetime.strptime(start_str, "%Y-%m-%d").date(),
-                datetime.strptime(end_str, "%Y-%m-%d").date(),
-                None
-            )
+            return _parse_ymd(start_str), _parse_ymd(end_str), None
         elif single_date:
-            date_obj = datetime.strptime(single_date, "%Y-%m-%d").date()
+            date_obj = _parse_ymd(single_date)
             return date_obj, date_obj, None
         elif default_to_today:
             today = datetime.utcnow().date()
@@ -70,12 +129,12 @@ def parse_iso_datetime_range(
         Tuple of (start_datetime, end_datetime, error_message)
     """
     try:
-        start_dt = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+        start_dt = _parse_iso(start_str)
+        end_dt = _parse_iso(end_str)
         if start_dt >= end_dt:
             return None, None, "Start date/time must be before end date/time"
         return start_dt, end_dt, None
-    except (ValueError, AttributeError):
+    except (ValueError, AttributeError, TypeError):
         return None, None, "Invalid date/datetime format. Use ISO 8601 (YYYY-MM-DDTHH:MM...)"
 
 
@@ -97,7 +156,11 @@ def validate_counter_range(
     """
     try:
         start = int(start_value) if start_value is not None else 0
-        end = int(end_value) if end_value is not None and str(end_value).strip() != '' else None
+        # Only strings can be blank; ints and other JSON numbers convert directly
+        if end_value is None or (isinstance(end_value, str) and (not end_value or end_value.isspace())):
+            end = None
+        else:
+            end = int(end_value)
 
         if end is not None and start >= end:
             return None, None, "Start value must be less than or equal to end value"
@@ -125,7 +188,7 @@ def validate_boundary_value(boundary_input: Any) -> Tuple[Optional[str], ErrorMe
 def validate_partition_data(
     partition_type: str,
     data: Dict[str, Any],
-    valid_partition_types: List[str]
+    valid_partition_types: Iterable[str] = VALID_PARTITION_TYPES
 ) -> Tuple[Optional[PartitionData], ErrorMessage]:
     """
     Validate partition-specific data based on type.
@@ -133,12 +196,14 @@ def validate_partition_data(
     Args:
         partition_type: The partition type (e.g., 'Daily', 'CustomCounter')
         data: Dictionary containing partition configuration
-        valid_partition_types: List of valid partition type strings
+        valid_partition_types: Collection of valid partition type strings;
+            defaults to VALID_PARTITION_TYPES
 
     Returns:
         Tuple of (validated_data_dict, error_message)
     """
-    if partition_type not in valid_partition_types:
+    # Non-strings (e.g. a JSON list) can't be hashed for the set lookup
+    if not isinstance(partition_type, str) or partition_type not in valid_partition_types:
         return None, f"Invalid partition_type: {partition_type}"
 
     if partition_type == 'CustomCounter':
@@ -227,6 +292,63 @@ def get_user_by_username(username: Optional[str]) -> Tuple[Optional[User], Optio
     return user, None
 
 
+@cache.memoize(timeout=60)
+def get_squad_goal_ids(squad_id: str) -> FrozenSet[str]:
+    """
+    Get the ids of all goals in a squad.
+
+    Cached because goals change far less often than entries are submitted;
+    callers that create or delete goals must call
+    invalidate_squad_goal_cache(squad_id).
+
+    Args:
+        squad_id: ID of the squad
+
+    Returns:
+        Frozen set of goal id strings
+    """
+    rows = Goal.query.with_entities(Goal.id).filter_by(squad_id=squad_id).all()
+    return frozenset(goal_id for (goal_id,) in rows)
+
+
+@cache.memoize(timeout=30)
+def get_goal_group_dicts(squad_id: str) -> List[Dict[str, Any]]:
+    """
+    Get the serialized goal groups of a squad.
+
+    Cached for a short time since the group list is read on most page
+    loads but only changes when an admin edits groups or goals.
+
+    Args:
+        squad_id: ID of the squad
+
+    Returns:
+        List of GoalGroup dictionaries
+    """
+    # to_dict() only needs each group's goal ids
+    groups = (
+        GoalGroup.query
+        .options(selectinload(GoalGroup.goals).options(load_only(Goal.id)))
+        .filter_by(squad_id=squad_id)
+        .all()
+    )
+    return [group.to_dict() for group in groups]
+
+
+def invalidate_squad_goal_cache(squad_id: str) -> None:
+    """
+    Drop cached goal and goal group lookups for a squad.
+
+    Must be called after committing any change that adds or removes goals
+    or goal groups, or edits a group.
+
+    Args:
+        squad_id: ID of the squad
+    """
+    cache.delete_memoized(get_squad_goal_ids, squad_id)
+    cache.delete_memoized(get_goal_group_dicts, squad_id)
+
+
 def get_goal_entries(
     user_id: int,
     squad_id: int,
@@ -257,13 +379,74 @@ def get_goal_entries(
     return query.first() if first_only else query.all()
 
 
+def get_goal_entry_dicts(
+    user_id: str,
+    squad_id: str,
+    boundary_value: str
+) -> List[Dict[str, Any]]:
+    """
+    Fetch serialized goal entries for a boundary without ORM hydration.
+
+    Selects only GoalEntry.DICT_COLUMNS and builds the same dicts as
+    GoalEntry.to_dict() straight from the result rows.
+
+    Args:
+        user_id: ID of the user
+        squad_id: ID of the squad
+        boundary_value: Boundary value (date or counter)
+
+    Returns:
+        List of entry dicts
+    """
+    rows = (
+        GoalEntry.query
+        .with_entities(*(getattr(GoalEntry, name) for name in GoalEntry.DICT_COLUMNS))
+        .filter(
+            GoalEntry.user_id == user_id,
+            GoalEntry.squad_id == squad_id,
+            GoalEntry.boundary_value == boundary_value
+        )
+        .all()
+    )
+    return [GoalEntry.row_to_dict(row) for row in rows]
+
+
+def get_goal_entries_bulk(
+    user_ids: Iterable[str],
+    squad_id: str,
+    boundary_value: str,
+    goal_ids: Iterable[str]
+) -> Dict[Tuple[str, str], GoalEntry]:
+    """
+    Fetch the entries for several users and goals at one boundary in one query.
+
+    Args:
+        user_ids: IDs of the users
+        squad_id: ID of the squad
+        boundary_value: Boundary value (date or counter)
+        goal_ids: IDs of the goals
+
+    Returns:
+        Dict mapping (user_id, goal_id) to its GoalEntry; pairs without an
+        entry are absent
+    """
+    entries = GoalEntry.query.filter(
+        GoalEntry.user_id.in_(list(user_ids)),
+        GoalEntry.squad_id == squad_id,
+        GoalEntry.boundary_value == boundary_value,
+        GoalEntry.goal_id.in_(list(goal_ids))
+    ).all()
+    return {(entry.user_id, entry.goal_id): entry for entry in entries}
+
+
 def upsert_goal_entry(
     user_id: int,
     squad_id: int,
     goal_id: str,
     boundary_value: str,
     value: Optional[str],
-    note: Optional[str]
+    note: Optional[str],
+    existing: Optional[Dict[Tuple[str, str], GoalEntry]] = None
 ) -> GoalEntry:
     """
     Create or update a goal entry.
@@ -275,16 +458,22 @@ def upsert_goal_entry(
         boundary_value: Boundary value (date or counter)
         value: Entry value
         note: Entry note
+        existing: Optional map from get_goal_entries_bulk() for this squad
+            and boundary; when given, the entry is looked up there instead
+            of queried
 
     Returns:
         The created or updated GoalEntry object
     """
-    entry = GoalEntry.query.filter_by(
-        user_id=user_id,
-        squad_id=squad_id,
-        goal_id=goal_id,
-        boundary_value=boundary_value
-    ).first()
+    if existing is not None:
+        entry = existing.get((user_id, goal_id))
+    else:
+        entry = GoalEntry.query.filter_by(
+            user_id=user_id,
+            squad_id=squad_id,
+            goal_id=goal_id,
+            boundary_value=boundary_value
+        ).first()
 
     if entry:
         entry.value = value
@@ -298,14 +487,120 @@ def upsert_goal_entry(
             value=value,
             note=note
         )
-        from models import db
         db.session.add(entry)
 
     return entry
 
 
+def upsert_goal_entries(
+    user_id: str,
+    squad_id: str,
+    boundary_value: str,
+    entries: Iterable[Tuple[str, Optional[str], Optional[str]]]
+) -> None:
+    """
+    Create or update several goal entries for one boundary in a single statement.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE on the (user_id, goal_id,
+    boundary_value) unique constraint. On dialects without native upsert
+    support, fetches the existing entries in one query and falls back to
+    upsert_goal_entry() per entry.
+
+    Args:
+        user_id: ID of the user
+        squad_id: ID of the squad
+        boundary_value: Boundary value (date or counter)
+        entries: (goal_id, value, note) tuples, one per goal
+    """
+    rows = [
+        {
+            "id": generate_uuid(),
+            "user_id": user_id,
+            "squad_id": squad_id,
+            "goal_id": goal_id,
+            "boundary_value": boundary_value,
+            "value": value,
+            "note": note,
+        }
+        for goal_id, value, note in entries
+    ]
+    if not rows:
+        return
+
+    insert = UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+    if insert is None:
+        existing = get_goal_entries_bulk(
+            [user_id], squad_id, boundary_value, [row["goal_id"] for row in rows]
+        )
+        for row in rows:
+            upsert_goal_entry(
+                user_id, squad_id, row["goal_id"], boundary_value, row["value"], row["note"],
+                existing=existing
+            )
+        return
+
+    stmt = insert(GoalEntry).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id', 'goal_id', 'boundary_value'],
+        set_={'value': stmt.excluded.value, 'note': stmt.excluded.note}
+    )
+    db.session.execute(stmt)
+
+
 # --- GOAL STATUS CALCULATION ---
 
+@lru_cache(maxsize=64)
+def is_counter_partition(partition_type: Optional[str]) -> bool:
+    """
+    Check whether a partition type is counter-based (e.g. CustomCounter).
+
+    Cached per type string, since it is asked for every entry and group
+    while only a handful of distinct types exist.
+
+    Args:
+        partition_type: The partition type, or None
+
+    Returns:
+        True for counter-based partition types, False otherwise
+    """
+    return partition_type is not None and "counter" in str(partition_type).lower()
+
+
+def _days_apart_multiple_of(days: int):
+    """
+    Build a check that a boundary falls a whole number of periods after the start.
+
+    Args:
+        days: Period length in days
+
+    Returns:
+        Function taking (boundary_date, start_date) and returning a bool
+    """
+    def check(boundary_date: datetime, start_date: datetime) -> bool:
+        return (boundary_date - start_date).days % days == 0
+    return check
+
+
+def _same_day_of_month(boundary_date: datetime, start_date: datetime) -> bool:
+    """
+    Check that a boundary falls on the start date's day of the month.
+
+    Months too short for that day use their last day instead (a group
+    starting Jan 31 has boundaries Feb 29 and Mar 31), matching the series
+    from generate_boundary_series.
+    """
+    last_day = calendar.monthrange(boundary_date.year, boundary_date.month)[1]
+    return boundary_date.day == min(start_date.day, last_day)
+
+
+# Alignment checks for time-based partitions that don't accept every date
+_PARTITION_CHECKS = {
+    "Weekly": _days_apart_multiple_of(7),
+    "BiWeekly": _days_apart_multiple_of(14),
+    "Monthly": _same_day_of_month,
+}
+
+
 def is_boundary_valid_for_partition(
     boundary_value: str,
     partition_type: str,
@@ -328,54 +623,50 @@ def is_boundary_valid_for_partition(
         True if the boundary is valid for this partition type, False otherwise
     """
     # Counter-based partitions: all integer boundaries are valid
-    is_counter = partition_type is not None and "counter" in str(partition_type).lower()
-    if is_counter:
+    if is_counter_partition(partition_type):
         try:
             int(boundary_value)
             return True
         except ValueError:
             return False
 
+    # Daily: every day is valid; unknown partition types accept all boundaries
+    check = _PARTITION_CHECKS.get(partition_type)
+    if check is None:
+        return True
+
     # Time-based partitions: check alignment with partition interval
     try:
-        from datetime import timedelta
-        from dateutil.relativedelta import relativedelta
-
-        boundary_date = datetime.fromisoformat(boundary_value)
+        # Cached parses: the same start date and boundaries recur across
+        # every goal and user in a group
+        boundary_date = _parse_iso(boundary_value)
 
         # Convert start_value to datetime if it's a string
         if isinstance(start_value, str):
-            start_date = datetime.fromisoformat(start_value)
+            start_date = _parse_iso(start_value)
         elif isinstance(start_value, datetime):
             start_date = start_value
         else:
             # Can't validate without proper start date
             return True
 
-        # Calculate the difference
-        if partition_type == "Daily":
-            # Every day is valid
-            return True
-        elif partition_type == "Weekly":
-            # Check if difference is a multiple of 7 days
-            delta_days = (boundary_date - start_date).days
-            return delta_days % 7 == 0
-        elif partition_type == "BiWeekly":
-            # Check if difference is a multiple of 14 days
-            delta_days = (boundary_date - start_date).days
-            return delta_days % 14 == 0
-        elif partition_type == "Monthly":
-            # Check if the day matches the start day (same day of month)
-            return boundary_date.day == start_date.day
-        else:
-            # Unknown partition type, accept all boundaries
-            return True
+        return check(boundary_date, start_date)
 
     except (ValueError, TypeError, AttributeError):
         # If we can't parse, accept the boundary
         return True
 
 
+# Goal types grouped by how check_goal_status compares the entry value
+_NUMERIC_GTE = frozenset({'count', 'above', 'threshold', 'ratio'})
+_NUMERIC_LTE = frozenset({'below'})
+_NUMERIC_RANGE = frozenset({'range', 'between'})
+_NUMERIC = _NUMERIC_GTE | _NUMERIC_LTE | _NUMERIC_RANGE
+_BOOL = frozenset({'boolean', 'achieved'})
+_TRUE_STR = frozenset({'true', '1', 'yes'})
+
+
+@lru_cache(maxsize=4096)
 def check_goal_status(
     goal_type: str,
     target: Optional[str],
@@ -385,6 +676,9 @@ def check_goal_status(
     """
     Determines if the goal is met, unmet, or blank based on type, target, and value.
 
+    Cached on its arguments: a history or status grid evaluates the same
+    goal settings against a handful of distinct values many times over.
+
     Args:
         goal_type: The type of goal (count, above, below, range, boolean, achieved, time)
         target: The target value for the goal
@@ -394,38 +688,40 @@ def check_goal_status(
     Returns:
         Status string: "met", "unmet", or "blank"
     """
-    if entry_value is None or entry_value.strip() == '':
+    # isspace() answers the same question as strip() == '' without a copy
+    if not entry_value or entry_value.isspace():
         return "blank"
 
     status = "unmet"
 
     try:
         # Standard Numeric/Comparison Goals
-        if goal_type in ['count', 'above', 'below', 'range', 'between', 'threshold', 'ratio']:
+        if goal_type in _NUMERIC:
             value = float(entry_value)
             target_num = float(target) if target else None
 
-            if goal_type in ['count', 'above', 'threshold', 'ratio']:
+            if goal_type in _NUMERIC_GTE:
                 if target_num is not None and value >= target_num:
                     status = "met"
-            elif goal_type == 'below':
+            elif goal_type in _NUMERIC_LTE:
                 if target_num is not None and value <= target_num:
                     status = "met"
-            elif goal_type in ['range', 'between']:
+            elif goal_type in _NUMERIC_RANGE:
                 target_max_num = float(target_max) if target_max else None
                 if target_num is not None and target_max_num is not None:
                     if value >= target_num and value <= target_max_num:
                         status = "met"
 
         # Boolean/Achieved Goals
-        elif goal_type in ['boolean', 'achieved']:
-            if entry_value.lower() in ['true', '1', 'yes']:
+        elif goal_type in _BOOL:
+            # Values are usually stored lowercase already; only fold when not
+            if entry_value in _TRUE_STR or entry_value.lower() in _TRUE_STR:
                 status = "met"
 
-        # Time Goals (Usually always 'met' if a value is entered)
+        # Time Goals (Usually always 'met' if a value is entered; blanks
+        # were returned above)
         elif goal_type == 'time':
-            if entry_value.strip():
-                status = "met"
+            status = "met"
 
     except (ValueError, TypeError):
         # If conversion fails, mark as unmet
@@ -23,6 +23,27 @@ interface SquadGoalEntryPageProps {
   squadId: string;
 }
 
+// ====================================================
+// Monthly Boundaries
+// ====================================================
+// A Monthly boundary falls on the start date's day of the month, clamped to
+// the last day of shorter months (Jan 31 -> Feb 29 -> Mar 31). Each one is
+// derived from the start by month index rather than by stepping from the
+// previous boundary, matching generate_boundary_series on the server.
+const parseYmd = (value: string): number[] => value.split("-").map((part) => parseInt(part, 10));
+
+const monthlyBoundary = (start: string, index: number): string => {
+  const [year, month, day] = parseYmd(start);
+  const lastDay = new Date(Date.UTC(year, month + index, 0)).getUTCDate();
+  return new Date(Date.UTC(year, month - 1 + index, Math.min(day, lastDay))).toISOString().split("T")[0];
+};
+
+const monthsSinceStart = (start: string, boundary: string): number => {
+  const [startYear, startMonth] = parseYmd(start);
+  const [year, month] = parseYmd(boundary);
+  return (year - startYear) * 12 + month - startMonth;
+};
+
 // ====================================================
 // Main Component
 // ====================================================
@@ -141,6 +162,8 @@ const SquadGoalEntryPage: React.FC<SquadGoalEntryPageProps> = ({ squadId }) => {
       return date.toISOString().split("T")[0];
     };
 
+    let monthIndex = 0;
+
     while (current <= endDate && current <= now) {
       const boundaryStr = getFormattedBoundary(current);
       boundaries.push(boundaryStr);
@@ -149,20 +172,21 @@ const SquadGoalEntryPage: React.FC<SquadGoalEntryPageProps> = ({ squadId }) => {
 
       switch (type) {
         case "Weekly":
-          next.setDate(next.getDate() + 7);
+          next.setUTCDate(next.getUTCDate() + 7);
           break;
         case "Monthly":
-          next.setMonth(next.getMonth() + 1);
+          monthIndex += 1;
+          next.setTime(Date.parse(monthlyBoundary(start as string, monthIndex)));
           break;
         case "Yearly":
-          next.setFullYear(next.getFullYear() + 1);
+          next.setUTCFullYear(next.getUTCFullYear() + 1);
           break;
         case "BiWeekly":
-          next.setDate(next.getDate() + 14);
+          next.setUTCDate(next.getUTCDate() + 14);
           break;
         case "Daily":
         default:
-          next.setDate(next.getDate() + 1);
+          next.setUTCDate(next.getUTCDate() + 1);
           break;
       }
 
@@ -462,7 +486,7 @@ const SquadGoalEntryPage: React.FC<SquadGoalEntryPageProps> = ({ squadId }) => {
             newDate.setUTCDate(newDate.getUTCDate() + delta * 7);
             break;
           case "Monthly":
-            newDate.setUTCMonth(newDate.getUTCMonth() + delta);
+            newDate.setTime(Date.parse(monthlyBoundary(startStr, monthsSinceStart(startStr, currentStr) + delta)));
             break;
           case "Yearly":
             newDate.setUTCFullYear(newDate.getUTCFullYear() + delta);